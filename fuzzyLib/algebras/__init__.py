@@ -0,0 +1,4 @@
+from fuzzyLib.algebras.algebra import Algebra
+from fuzzyLib.algebras.godel_algebra import GodelAlgebra
+from fuzzyLib.algebras.lukasiewicz_algebra import LukasiewiczAlgebra
+from fuzzyLib.algebras._kernels import warmup
@@ -0,0 +1,75 @@
+"""
+Compiled kernels of algebra operations.\n
+Each kernel takes flat float arrays of the same size and writes the result to the preallocated output array
+in a single pass, without temporary arrays.
+"""
+import numpy as np
+
+from fuzzyLib.utils._jit import njit, prange, NUMBA_AVAILABLE
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def lukasiewicz_t_norm(a, b, out):
+    for i in prange(a.shape[0]):
+        out[i] = max(0.0, a[i] + b[i] - 1.0)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def lukasiewicz_s_norm(a, b, out):
+    for i in prange(a.shape[0]):
+        out[i] = min(1.0, a[i] + b[i])
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def lukasiewicz_implication(a, b, out):
+    for i in prange(a.shape[0]):
+        out[i] = min(1.0, 1.0 - a[i] + b[i])
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def godel_t_norm(a, b, out):
+    for i in prange(a.shape[0]):
+        out[i] = min(a[i], b[i])
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def godel_s_norm(a, b, out):
+    for i in prange(a.shape[0]):
+        out[i] = max(a[i], b[i])
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def godel_implication(a, b, out):
+    for i in prange(a.shape[0]):
+        out[i] = max(1.0 - a[i], b[i])
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def negation(a, out):
+    for i in prange(a.shape[0]):
+        out[i] = 1.0 - a[i]
+    return out
+
+
+def warmup():
+    """
+    Compiles every kernel for float64 and float32 arrays by calling it on a small array. Opt-in: call it at startup
+    to pay compilation up front instead of on the first call with arrays, otherwise each kernel is compiled lazily
+    when first used. Compiled code is cached on disk (cache=True), so following processes only load it.
+    Does nothing if numba is not available.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    for dtype in (np.float64, np.float32):
+        a = np.zeros(2, dtype=dtype)
+        out = np.empty(2, dtype=dtype)
+        for kernel in (lukasiewicz_t_norm, lukasiewicz_s_norm, lukasiewicz_implication,
+                       godel_t_norm, godel_s_norm, godel_implication):
+            kernel(a, a, out)
+        negation(a, out)
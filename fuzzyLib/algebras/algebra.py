@@ -1,15 +1,20 @@
+import os
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
 
 import numpy as np
 from fuzzyLib.fuzzySetsFol.fuzzy_set import MembershipDegree
+from fuzzyLib.utils._jit import NUMBA_AVAILABLE
+
+_SKIP_VALIDATE = os.environ.get('FUZZYLIB_SKIP_VALIDATE') == '1'
 
 
 def validate_input(function):
     """
-    Decorator for functions in algebras that checks dimensions. If the input is iterable, it is converted to np.ndarray.
+    Decorator for functions in algebras that checks dimensions. If the input is a list or tuple, it is converted to
+    np.ndarray.
     For the operation to make sense, the first dimension must match. If one input is a float and the other is an array,
     for example, the operation continues if the dimensions match.
+    Setting FUZZYLIB_SKIP_VALIDATE=1 environment variable skips the dimension check, inputs are only converted.
 
     :param function: operation, that takes two arguments a and b, for example: implication, t_norm, s_norm
     :return: decorated negation
@@ -18,21 +23,34 @@ def validate_input(function):
     We function works on scalars or on the np.ndarrays with the same size 
     """
 
-    
-    def operation(a, b):
-        if isinstance(a, Iterable):
-            a = np.array(a)
+    if _SKIP_VALIDATE:
+        def operation(a, b, out=None):
+            if isinstance(a, (list, tuple)):
+                a = np.asarray(a)
+            if isinstance(b, (list, tuple)):
+                b = np.asarray(b)
+            return function(a, b, out=out)
+
+        return operation
+
+    def operation(a, b, out=None):
+        if type(a) is np.ndarray:
+            size_a = a.shape[0] if a.ndim else 1
+        elif isinstance(a, (list, tuple)):
+            a = np.asarray(a)
             size_a = a.shape[0]
         else:
             size_a = 1
-        if isinstance(b, Iterable):
-            b = np.array(b)
+        if type(b) is np.ndarray:
+            size_b = b.shape[0] if b.ndim else 1
+        elif isinstance(b, (list, tuple)):
+            b = np.asarray(b)
             size_b = b.shape[0]
         else:
             size_b = 1
         if size_a != size_b:
             raise ValueError(f'Dimensions {size_a} and {size_b} are not compatible')
-        return function(a, b)
+        return function(a, b, out=out)
 
     return operation
 
@@ -41,19 +59,99 @@ def expand_negation_argument(negation):
     """
     Expand argument dimensions for negation.\n
     For example passing: [0.1, 0.2] allows to calculate negation and returns an array of size 2.
+    Lists and tuples are converted to np.ndarray, other inputs are passed unchanged.
 
     :param negation: negation function, takes one argument
     :return: decorated function
     """
 
-    def operation(a):
-        if isinstance(a, Iterable):
-            a = np.array(a)
-        return negation(a)
+    def operation(a, out=None):
+        if isinstance(a, (list, tuple)):
+            a = np.asarray(a)
+        return negation(a, out=out)
 
     return operation
 
 
+_KERNEL_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+
+def can_store_result(buffer, other) -> bool:
+    """
+    Check if intermediate result of an operation can be used to store its final result, that is if it is
+    a float np.ndarray with the shape of result broadcast with the other operand. Allows to finish operations
+    in place, without allocating another array.
+
+    :param buffer: intermediate result
+    :param other: the other operand of an operation
+    :return: True if buffer can be used as output
+    """
+    return (type(buffer) is np.ndarray and buffer.dtype.kind == 'f'
+            and buffer.shape == np.broadcast_shapes(buffer.shape, np.shape(other)))
+
+
+def _is_kernel_output(out, a) -> bool:
+    """
+    Check if out can be passed to a compiled kernel as flat output for a, that is it is either None
+    or C-contiguous array of the dtype and shape of a."""
+    return out is None or (type(out) is np.ndarray and out.dtype == a.dtype and out.shape == a.shape
+                           and out.flags.c_contiguous)
+
+
+def binary_kernel(kernel):
+    """
+    Decorator for functions in algebras that computes the operation with compiled kernel, if both inputs are float64
+    or both are float32 np.ndarrays of the same shape. Validation is skipped in that case, other inputs are passed to decorated function.
+    If numba is not available, function is returned unchanged.
+
+    :param kernel: compiled kernel taking flat arrays a, b and output array
+    :return: decorator
+    """
+
+    def decorator(function):
+        if not NUMBA_AVAILABLE:
+            return function
+
+        def operation(a, b, out=None):
+            if (type(a) is np.ndarray and type(b) is np.ndarray and a.shape == b.shape
+                    and a.dtype == b.dtype and a.dtype in _KERNEL_DTYPES and _is_kernel_output(out, a)):
+                if out is None:
+                    out = np.empty(a.shape, dtype=a.dtype)
+                kernel(a.reshape(-1), b.reshape(-1), out.reshape(-1))
+                return out
+            return function(a, b, out=out)
+
+        return operation
+
+    return decorator
+
+
+def unary_kernel(kernel):
+    """
+    Decorator for negation that computes it with compiled kernel, if the input is a float64 or float32 np.ndarray.
+    If numba is not available, function is returned unchanged.
+
+    :param kernel: compiled kernel taking flat array a and output array
+    :return: decorator
+    """
+
+    def decorator(function):
+        if not NUMBA_AVAILABLE:
+            return function
+
+        def operation(a, out=None):
+            if type(a) is np.ndarray and a.dtype in _KERNEL_DTYPES and _is_kernel_output(out, a):
+                if out is None:
+                    out = np.empty(a.shape, dtype=a.dtype)
+                kernel(a.reshape(-1), out.reshape(-1))
+                return out
+            return function(a, out=out)
+
+        return operation
+
+    return decorator
+
+
 class Algebra(ABC):
     """
     Class that represents algebra for specific fuzzy logic.\n
@@ -64,24 +162,27 @@ class Algebra(ABC):
     - S-norm: generalized OR
     - Negation
     - Implication
+
+    Every operation accepts optional out argument, array to which the result is written (like in numpy ufuncs),
+    so callers can reuse one buffer instead of allocating new array on every call.
     """
 
     @staticmethod
     @abstractmethod
-    def t_norm(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def t_norm(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         pass
 
     @staticmethod
     @abstractmethod
-    def s_norm(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def s_norm(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         pass
 
     @staticmethod
     @abstractmethod
-    def negation(a: MembershipDegree) -> MembershipDegree:
+    def negation(a: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         pass
 
     @staticmethod
     @abstractmethod
-    def implication(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def implication(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         pass
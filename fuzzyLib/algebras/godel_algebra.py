@@ -1,54 +1,70 @@
 import numpy as np
 
-from fuzzyLib.algebras.algebra import Algebra, validate_input, expand_negation_argument
+from fuzzyLib.algebras import _kernels
+from fuzzyLib.algebras.algebra import Algebra, validate_input, expand_negation_argument, binary_kernel, \
+    unary_kernel, can_store_result
 from fuzzyLib.fuzzySetsFol.fuzzy_set import MembershipDegree
 
 
 class GodelAlgebra(Algebra):
 
     @staticmethod
+    @binary_kernel(_kernels.godel_implication)
     @validate_input
-    def implication(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def implication(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         """
         Calculate the Gödel implication.
 
         :param a: first value
         :param b: second value
+        :param out: optional array to store the result in
         :return: max(1 - a, b)
         """
-        return np.maximum(1 - a, b)
+        if out is not None and np.may_share_memory(out, b):
+            # 1 - a is written to out before b is read, so b must not be overwritten by it
+            b = np.copy(b)
+        buffer = np.subtract(1., a, out=out)
+        if can_store_result(buffer, b):
+            return np.maximum(buffer, b, out=buffer)
+        return np.maximum(buffer, b)
 
     @staticmethod
+    @unary_kernel(_kernels.negation)
     @expand_negation_argument
-    def negation(a: MembershipDegree) -> MembershipDegree:
+    def negation(a: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         """
         Calculate the Gödel negation.
 
         :param a: value
+        :param out: optional array to store the result in
         :return: 1 - a
         """
-        return 1 - a
+        return np.subtract(1, a, out=out)
 
     @staticmethod
+    @binary_kernel(_kernels.godel_s_norm)
     @validate_input
-    def s_norm(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def s_norm(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         """
         Calculate the Gödel S-norm.
 
         :param a: first value
         :param b: second value
+        :param out: optional array to store the result in
         :return: max(a, b)
         """
-        return np.maximum(a, b)
+        return np.maximum(a, b, out=out)
 
     @staticmethod
+    @binary_kernel(_kernels.godel_t_norm)
     @validate_input
-    def t_norm(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def t_norm(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         """
         Calculate the Gödel T-norm.
 
         :param a: first value
         :param b: second value
+        :param out: optional array to store the result in
         :return: min(a, b)
         """
-        return np.minimum(a, b)
+        return np.minimum(a, b, out=out)
@@ -1,54 +1,71 @@
 import numpy as np
 
-from fuzzyLib.algebras.algebra import Algebra, validate_input, expand_negation_argument
+from fuzzyLib.algebras import _kernels
+from fuzzyLib.algebras.algebra import Algebra, validate_input, expand_negation_argument, binary_kernel, \
+    unary_kernel, can_store_result
 from fuzzyLib.fuzzySetsFol.fuzzy_set import MembershipDegree
 
 
 class LukasiewiczAlgebra(Algebra):
 
     @staticmethod
+    @binary_kernel(_kernels.lukasiewicz_implication)
     @validate_input
-    def implication(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def implication(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         """
         Calculate the Lukasiewicz implication.
 
         :param a: first value
         :param b: second value
+        :param out: optional array to store the result in
         :return: min(1, 1 - a + b)
         """
-        return np.minimum(1., 1 - a + b)
+        if out is not None and np.may_share_memory(out, b):
+            # 1 - a is written to out before b is read, so b must not be overwritten by it
+            b = np.copy(b)
+        buffer = np.subtract(1., a, out=out)
+        if can_store_result(buffer, b):
+            np.add(buffer, b, out=buffer)
+            return np.minimum(buffer, 1., out=buffer)
+        return np.minimum(buffer + b, 1.)
 
     @staticmethod
+    @unary_kernel(_kernels.negation)
     @expand_negation_argument
-    def negation(a: MembershipDegree) -> MembershipDegree:
+    def negation(a: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         """
         Calculate the Lukasiewicz negation.
 
         :param a: value
+        :param out: optional array to store the result in
         :return: 1 - a
         """
-        return 1 - a
+        return np.subtract(1, a, out=out)
 
     @staticmethod
+    @binary_kernel(_kernels.lukasiewicz_s_norm)
     @validate_input
-    def s_norm(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def s_norm(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         """
         Calculate the Lukasiewicz S-norm.
 
         :param a: first value
         :param b: second value
+        :param out: optional array to store the result in
         :return: min(1, a + b)
         """
-        return np.minimum(1., a + b)
+        return np.clip(a + b, None, 1., out=out)
 
     @staticmethod
+    @binary_kernel(_kernels.lukasiewicz_t_norm)
     @validate_input
-    def t_norm(a: MembershipDegree, b: MembershipDegree) -> MembershipDegree:
+    def t_norm(a: MembershipDegree, b: MembershipDegree, out: np.ndarray = None) -> MembershipDegree:
         """
         Calculate the Lukasiewicz T-norm.
 
         :param a: first value
         :param b: second value
+        :param out: optional array to store the result in
         :return: max(0.0, a + b - 1)
         """
-        return np.maximum(.0, a + b - 1.0)
+        return np.clip(a + b - 1.0, .0, None, out=out)
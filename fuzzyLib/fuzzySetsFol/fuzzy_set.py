@@ -1,5 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from weakref import WeakKeyDictionary
 from typing import NewType, Iterable, Tuple, Sequence, Callable
 
 import numpy as np
@@ -18,6 +19,13 @@ For type two fuzzy set membership degree is a Tuple[float, float]\n
 For other types of fuzzy sets is a membership degree defined by user.
 """
 
+MEMBERSHIP_DTYPE = np.float32
+"""
+Type in which tables of membership degrees (values of clauses over domains, cut consequents) are stored.
+Membership degrees lie in [0, 1], so single precision is enough and halves memory traffic of rule evaluation.
+Domains and crisp outputs stay in double precision.
+"""
+
 DEFAULT_COLOR_SET = list(colors.TABLEAU_COLORS.keys())
 
 
@@ -46,8 +54,48 @@ def _mf_return(fuzzy_set: FuzzySet, domain: Iterable[float or int]) -> (Iterable
     return mf_res, takes
 
 
+def _is_broadcast_safe(membership_function: Callable) -> bool:
+    """
+    Probe if membership function can be called with np.ndarray and returns an array of the same shape."""
+    probe = np.zeros(2)
+    try:
+        result = membership_function(probe)
+    except Exception:
+        return False
+    return isinstance(result, np.ndarray) and result.shape == probe.shape
+
+
+def _vectorize(membership_function: Callable, vectorized: bool or None = None) -> Callable:
+    """
+    Return membership function that can be called both with scalars and arrays.
+    Functions which already broadcast over np.ndarray are returned unchanged, others are wrapped with np.frompyfunc.
+
+    :param membership_function: membership function of a set
+    :param vectorized: True if function is known to broadcast, False to always wrap it, None to probe it
+    :return: membership function that accepts arrays
+    """
+    if vectorized is None:
+        vectorized = _is_broadcast_safe(membership_function)
+    if vectorized:
+        return membership_function
+
+    ufunc = np.frompyfunc(membership_function, 1, 1)
+
+    def vectorized_membership_function(x):
+        return np.asarray(ufunc(x)).astype(np.float64)
+
+    return vectorized_membership_function
+
+
+_values_cache = WeakKeyDictionary()
+"""
+Values of fuzzy sets calculated on domains, shared by clauses. Keys are fuzzy sets held by weak references, so values
+are dropped together with their fuzzy set. Setters of membership functions drop values of their fuzzy set.
+"""
+
 
 class FuzzySet(ABC):
+    __slots__ = ('__weakref__',)
 
     @abstractmethod
     def __call__(self, x: float or Iterable[float]) -> MembershipDegree:
@@ -58,7 +106,7 @@ class FuzzySet(ABC):
 
     def plot(self,
              axis: plt.axis or None = None,
-             domain: Iterable[float] = np.arange(0, 1.0001, 0.0001),
+             domain: Iterable[float] or None = None,
              y_range: Tuple[float] or None = None,
              grid: bool = True,
              title: str or None = None,
@@ -69,12 +117,14 @@ class FuzzySet(ABC):
              **kwargs):
         """
         Function for ploting the fuzzy sets. The figure on the created graph represent the membership function value
-        for the input. """
+        for the input. If domain is not given, 10001 evenly spaced points from [0, 1] are used. """
 
         if not axis:
             fig, axis = plt.subplots(**kwargs)
         if title:
             axis.set_title(title)
+        if domain is None:
+            domain = np.linspace(0.0, 1.0, 10001)
 
         mf_return, takes = _mf_return(self, domain)
         label = _parse_anystr(label, takes, default=lambda: "")
@@ -3,7 +3,7 @@ from typing import Callable, Iterable, NoReturn, Sequence, AnyStr
 
 import numpy as np
 
-from fuzzyLib.fuzzySetsFol.fuzzy_set import FuzzySet
+from fuzzyLib.fuzzySetsFol.fuzzy_set import _values_cache, FuzzySet, _vectorize
 
 
 
@@ -41,12 +41,15 @@ class IntervalType2FuzzySet(FuzzySet):
     >>> fuzzy_set([0.0, 2.5])
     (array([0.5, 1]), array([0.9241, 1]))
     """
+    __slots__ = ('__upper_membership_function', '__lower_membership_function')
+
     __upper_membership_function: Callable[[float], float]
     __lower_membership_function: Callable[[float], float]
 
     def __init__(self,
                  lower_membership_function: Callable[[float], float],
-                 upper_membership_function: Callable[[float], float]):
+                 upper_membership_function: Callable[[float], float],
+                 vectorized: bool or None = None):
         """
         Create interval type II fuzzy set with given lower membership function and upper membership function.\n
         Both functions should return values from range [0, 1].\n
@@ -57,24 +60,38 @@ class IntervalType2FuzzySet(FuzzySet):
 
         :param upper_membership_function: upper membership function of a set
         :param lower_membership_function: lower membership function of a set
+        :param vectorized: True if membership functions already work on np.ndarray (skips the probe),
+            False if they work only on scalars, None to detect it
         """
         if not callable(upper_membership_function) or not callable(lower_membership_function):
             raise ValueError('Membership functions should be callable')
-        self.__upper_membership_function = np.vectorize(upper_membership_function)
-        self.__lower_membership_function = np.vectorize(lower_membership_function)
+        self.__upper_membership_function = _vectorize(upper_membership_function, vectorized)
+        self.__lower_membership_function = _vectorize(lower_membership_function, vectorized)
 
-    def __call__(self, x: float or Iterable[float]) -> np.ndarray: # type: ignore
+    def __call__(self, x: float or Iterable[float], out: np.ndarray or None = None) -> np.ndarray: # type: ignore
         """
         Calculate a membership degree (lower_membership, upper_membership),
         raises an exception if lower_membership > upper_membership.
 
         :param x: element of domain
+        :param out: optional buffer of shape (2,) + shape of x the result is written to, reusing it between calls
+            avoids allocating the result; the buffer is owned by the caller and returned
         :return: membership degree of an element as tuple (lmf(x), umf(x))
         """
-        lower_membership, upper_membership = self.__lower_membership_function(x), self.__upper_membership_function(x)
-        if np.any(lower_membership > upper_membership):
+        # only sequences are converted, scalars keep fast paths of membership functions
+        if isinstance(x, (list, tuple)):
+            x = np.asarray(x)
+        shape = (2,) + np.shape(x)
+        # both memberships are written straight into rows of one (2, ...) array, without temporary copies
+        if out is None:
+            out = np.empty(shape, dtype=np.float64)
+        elif out.shape != shape:
+            raise ValueError('Output buffer must have shape ' + str(shape))
+        out[0] = self.__lower_membership_function(x)
+        out[1] = self.__upper_membership_function(x)
+        if np.greater(out[0], out[1]).any():
             raise ValueError('Lower membership function returned higher value than upper membership function')
-        return np.array([lower_membership, upper_membership])
+        return out
 
     @property
     def upper_membership_function(self) -> Callable[[float], float]:
@@ -96,6 +113,7 @@ class IntervalType2FuzzySet(FuzzySet):
         if not callable(new_upper_membership_function):
             raise ValueError('Membership function should be callable')
         self.__upper_membership_function = new_upper_membership_function
+        _values_cache.pop(self, None)
 
     @property
     def lower_membership_function(self) -> Callable[[float], float]:
@@ -117,6 +135,7 @@ class IntervalType2FuzzySet(FuzzySet):
         if not callable(new_lower_membership_function):
             raise ValueError('Membership function should be callable')
         self.__lower_membership_function = new_lower_membership_function
+        _values_cache.pop(self, None)
 
     def __parse_anystr(self, item: AnyStr or Sequence[AnyStr]): # type: ignore
         if isinstance(item, Sequence) and not isinstance(item, str):
@@ -3,7 +3,7 @@ from typing import Callable, NoReturn, Iterable, Sequence, AnyStr
 
 import numpy as np
 import matplotlib.pyplot as plt
-from fuzzyLib.fuzzySetsFol.fuzzy_set import FuzzySet
+from fuzzyLib.fuzzySetsFol.fuzzy_set import _values_cache, FuzzySet, _vectorize
 
 
 class Type1FuzzySet(FuzzySet):
@@ -39,20 +39,23 @@ class Type1FuzzySet(FuzzySet):
     array([0.5, 0.9241])
     """
 
+    __slots__ = ('__membership_function',)
+
     __membership_function: Callable[[float], float]
 
-    def __init__(self, membership_function: Callable[[float], float]):
+    def __init__(self, membership_function: Callable[[float], float], vectorized: bool or None = None):
         """
         Create type I fuzzy set with given membership function.\n
         Membership function should return values from range [0, 1], but it is not required in library.
 
         :param membership_function: membership function of a set
+        :param vectorized: True if membership function already works on np.ndarray (skips the probe),
+            False if it works only on scalars, None to detect it
         """
         if not callable(membership_function):
             raise ValueError('Membership function must be callable')
-        #we use vecotrizing so we could use membership_function not only with scalars but also with arrays:
-        self.__membership_function = np.vectorize(membership_function)
-        
+        # membership functions that do not broadcast are wrapped, so we could use them also with arrays:
+        self.__membership_function = _vectorize(membership_function, vectorized)
 
     def __call__(self, x: float or Iterable[float]) -> float or np.ndarray: # type: ignore
         """
@@ -61,6 +64,9 @@ class Type1FuzzySet(FuzzySet):
         :param x: element of domain
         :return: membership degree of an element
         """
+        # only sequences are converted, scalars keep fast paths of membership functions and give a float back
+        if isinstance(x, (list, tuple)):
+            x = np.asarray(x)
         return self.__membership_function(x)
 
     @property
@@ -83,6 +89,7 @@ class Type1FuzzySet(FuzzySet):
         if not callable(new_membership_function):
             raise ValueError('Membership function must be callable')
         self.__membership_function = new_membership_function
+        _values_cache.pop(self, None)
 
     def __parse_anystr(self, item: AnyStr or Sequence[AnyStr]) -> str: # type: ignore
         """
@@ -0,0 +1,11 @@
+"""
+Compiled kernels used by clauses.
+"""
+from fuzzyLib.utils._jit import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def find_index(x, domain_min, inv_precision, out):
+    for i in prange(x.shape[0]):
+        out[i] = int((x[i] - domain_min) * inv_precision + 0.5)
+    return out
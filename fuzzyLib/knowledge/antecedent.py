@@ -13,10 +13,15 @@ class Antecedent(ABC):
     It is the abstract class that represent the method of how the activation of the interface would be callculated.
     It is used for creating term that represent the actual "everythin what is before implication symbol"
     """
+    __slots__ = ('__algebra', '__t_norm', '__s_norm')
+
     def __init__(self, algebra: Algebra):
         if not isinstance(algebra, Algebra):
             raise TypeError('Algebra must be of Algebra type')
         self.__algebra = algebra
+        # operations are looked up once here, not through the algebra on every firing
+        self.__t_norm = algebra.t_norm
+        self.__s_norm = algebra.s_norm
 
     @property
     @abstractmethod
@@ -31,3 +36,21 @@ class Antecedent(ABC):
         :return: algebra
         """
         return self.__algebra
+
+    @property
+    def t_norm(self) -> Callable[[MembershipDegree, MembershipDegree], MembershipDegree]:
+        """
+        Getter of the t-norm of the algebra.
+
+        :return: t-norm
+        """
+        return self.__t_norm
+
+    @property
+    def s_norm(self) -> Callable[[MembershipDegree, MembershipDegree], MembershipDegree]:
+        """
+        Getter of the s-norm of the algebra.
+
+        :return: s-norm
+        """
+        return self.__s_norm
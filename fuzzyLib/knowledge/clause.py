@@ -1,10 +1,74 @@
-from fuzzyLib.fuzzySetsFol.fuzzy_set import FuzzySet, MembershipDegree
+from fuzzyLib.fuzzySetsFol.fuzzy_set import _values_cache, FuzzySet, MembershipDegree, MEMBERSHIP_DTYPE
 from fuzzyLib.knowledge.linguistic_variable import LinguisticVariable
+from fuzzyLib.knowledge import _kernels
+from fuzzyLib.utils._jit import NUMBA_AVAILABLE
 
 import numpy as np
 from typing import NoReturn, Iterable
 
 
+def _cached_values(fuzzy_set: FuzzySet, linguistic_variable: LinguisticVariable,
+                   dtype: np.dtype) -> Iterable[MembershipDegree]:
+    """
+    Returns values of fuzzy set calculated on the domain of linguistic variable. Values are shared between clauses
+    with the same fuzzy set and domain bounds, so the membership function is evaluated once for all of them.
+    Values are kept as long as their fuzzy set exists and its membership functions are not changed,
+    returned arrays are read-only.
+
+    :param fuzzy_set: fuzzy set providing membership function
+    :param linguistic_variable: linguistic variable providing domain
+    :param dtype: type in which values are stored
+    :return: array of membership degrees
+    """
+    domain = linguistic_variable.domain
+    key = (domain.min, domain.max, domain.precision, np.dtype(dtype))
+    try:
+        fuzzy_set_values = _values_cache[fuzzy_set]
+    except KeyError:
+        fuzzy_set_values = _values_cache[fuzzy_set] = {}
+    except TypeError:
+        # fuzzy sets which can not be referenced weakly are not cached
+        fuzzy_set_values = {}
+    values = fuzzy_set_values.get(key)
+    if values is None:
+        values = np.ascontiguousarray(fuzzy_set(domain()), dtype=dtype)
+        values.setflags(write=False)
+        fuzzy_set_values[key] = values
+    return values
+
+
+def _find_domain_index(x: Iterable[float] or float, domain_min: float, domain_max: float, inv_precision: float,
+                       validate: bool) -> int or Iterable[int]:
+    """
+    Returns the index of given x in the array of values calculated on the domain.
+
+    :param x: element of domain
+    :param domain_min: minimum value in the domain
+    :param domain_max: maximum value in the domain
+    :param inv_precision: 1 / precision of the domain
+    :param validate: check if x is inside the domain
+    :return: index of the element
+    """
+    if np.isscalar(x):
+        if validate and (x > domain_max or x < domain_min):
+            raise ValueError('There is no such value in the domain')
+        return int((x - domain_min) * inv_precision + 0.5)
+
+    x = np.asarray(x)
+    # min and max are reductions without temporary boolean arrays
+    if validate and x.size and (x.min() < domain_min or x.max() > domain_max):
+        raise ValueError('There is no such value in the domain')
+    if NUMBA_AVAILABLE and (x.dtype == np.float64 or x.dtype == np.float32):
+        index = np.empty(x.shape, dtype=np.intp)
+        _kernels.find_index(x.reshape(-1), domain_min, inv_precision, index.reshape(-1))
+        return index
+    # values are non-negative, so adding 0.5 and truncating rounds them like the scalar path
+    index = np.subtract(x, domain_min, dtype=np.float64)
+    index *= inv_precision
+    index += 0.5
+    return index.astype(np.intp)
+
+
 class Clause:
     """
     Class representing a clause.
@@ -38,6 +102,21 @@ class Clause:
     0.1
     """
 
+    DTYPE = MEMBERSHIP_DTYPE
+    """
+    Type in which membership degrees over the domain are stored, MEMBERSHIP_DTYPE by default.
+    Set it to np.float64 before creating clauses to keep double precision.
+    """
+
+    VALIDATE_DOMAIN = True
+    """
+    Default for validate argument of get_value. Setting it to False skips the check if values are inside
+    the domain, which is safe when inputs come from the domain by construction.
+    """
+
+    __slots__ = ('__linguistic_variable', '__gradation_adjective', '__fuzzy_set', '__values',
+                 '__domain_min', '__domain_max', '__inv_precision')
+
     __linguistic_variable: LinguisticVariable
     __gradation_adjective: str
     __fuzzy_set: FuzzySet
@@ -60,17 +139,45 @@ class Clause:
         self.__linguistic_variable = linguistic_variable
         self.__gradation_adjective = gradation_adjective
         self.__fuzzy_set = fuzzy_set
+        self._cache_domain()
         self.__values = self._calculate_values() # callculate value for every element in domain
 
-    def get_value(self, x: Iterable[float] or float) -> MembershipDegree or Iterable[MembershipDegree]:
+    def get_value(self, x: Iterable[float] or float,
+                  validate: bool or None = None) -> MembershipDegree or Iterable[MembershipDegree]:
         """
         Returns a value representing membership degree.
 
         :param x: element of domain
+        :param validate: check if x is inside the domain, pass False only if caller guarantees it,
+            None uses Clause.VALIDATE_DOMAIN
         :return: membership degree
         """
-        index = self._find_index(x)
-        return np.take(self.__values, index, axis=-1)   # it takes given index from the __values, alongs side axis = -1
+        if validate is None:
+            validate = Clause.VALIDATE_DOMAIN
+        # attributes are bound to locals once, scalar index is found inline to avoid the method call
+        values = self.__values
+        if type(x) is float or np.isscalar(x):
+            domain_min = self.__domain_min
+            if validate and (x > self.__domain_max or x < domain_min):
+                raise ValueError('There is no such value in the domain')
+            index = int((x - domain_min) * self.__inv_precision + 0.5)
+        else:
+            index = self._find_index(x, validate)
+        if values.ndim == 1:
+            return values[index]
+        return values[..., index]   # it takes given index from the __values, alongs side axis = -1
+
+    def _cache_domain(self) -> NoReturn:
+        """
+        Stores bounds and inverted precision of the linguistic variable's domain, so finding an index
+        does not go through the properties on every call.
+
+        :return: NoReturn
+        """
+        domain = self.__linguistic_variable.domain
+        self.__domain_min = domain.min
+        self.__domain_max = domain.max
+        self.__inv_precision = 1.0 / domain.precision
 
     def _calculate_values(self) -> Iterable[MembershipDegree]:
         """
@@ -78,21 +185,22 @@ class Clause:
 
         :return: array of membership degrees
         """
-        return self.__fuzzy_set(self.linguistic_variable.domain())
+        return _cached_values(self.__fuzzy_set, self.__linguistic_variable, Clause.DTYPE)
 
-    def _find_index(self, x: Iterable[float] or float) -> int or Iterable[int]:
+    def _find_index(self, x: Iterable[float] or float, validate: bool or None = None) -> int or Iterable[int]:
         """
         Returns the index of given x in the values table.
         Since the domain is the list of all our values from MIN to MAX, than we need to find the index that
         would be the best for representing out domain. 
         
         :param x: element of domain
+        :param validate: check if x is inside the domain, without the check indexes of values outside of it
+            are meaningless, None uses Clause.VALIDATE_DOMAIN
         :return: index of the element
         """
-        if np.any(x > self.linguistic_variable.domain.max) or np.any(x < self.linguistic_variable.domain.min):
-            raise ValueError('There is no such value in the domain')
-        return np.round((x - self.linguistic_variable.domain.min) / self.linguistic_variable.domain.precision).astype(
-            int)
+        if validate is None:
+            validate = Clause.VALIDATE_DOMAIN
+        return _find_domain_index(x, self.__domain_min, self.__domain_max, self.__inv_precision, validate)
 
     @property
     def linguistic_variable(self) -> LinguisticVariable:
@@ -115,6 +223,8 @@ class Clause:
             raise TypeError('Linguistic variable must be a LinguisticVariable type')
 
         self.__linguistic_variable = linguistic_variable
+        self._cache_domain()
+        self.__values = self._calculate_values()
 
     @property
     def fuzzy_set(self) -> FuzzySet:
@@ -136,6 +246,7 @@ class Clause:
         if not isinstance(fuzzy_set, FuzzySet):
             raise TypeError("Fuzzy set must be a FuzzySet type")
         self.__fuzzy_set = fuzzy_set
+        self.__values = self._calculate_values()
 
     @property
     def gradation_adjective(self) -> str:
@@ -160,6 +271,8 @@ class Clause:
     def values(self) -> Iterable[MembershipDegree]:
         """
         Getter of values of fuzzy set calculated on domain of provided LinguisticVariable.
+        Calculated values are a read-only contiguous array shared with other clauses, so there is no need
+        to copy them defensively. Code that modifies values (e.g. cuts a fuzzy set) must make its own copy.
 
         :return: values of membership function on linguistic variable's domain
         """
@@ -0,0 +1,143 @@
+from fuzzyLib.fuzzySetsFol.fuzzy_set import MembershipDegree
+from fuzzyLib.knowledge.clause import Clause, _find_domain_index
+from fuzzyLib.knowledge.linguistic_variable import LinguisticVariable
+
+import numpy as np
+from typing import Iterable, List, Sequence, Tuple
+
+
+class ClauseBank:
+    """
+    Class storing values of many clauses defined on the same domain in one array, one row per clause.
+    Membership degrees of all clauses for an element of the domain lie in one column of the array,
+    so they are read together instead of from separate arrays of every clause.
+
+    Attributes
+    --------------------------------------------
+    __values : np.ndarray
+        values of clauses on the domain, i-th row holds values of i-th clause
+
+    __metadata : List[Tuple[LinguisticVariable, str]]
+        linguistic variable and gradation adjective of each clause
+
+    Methods
+    --------------------------------------------
+    get_value(self, clause_index: int, x: float) -> MembershipDegree
+        returns a value representing membership degree to a clause of given index
+
+    get_values(self, x: float) -> Iterable[MembershipDegree]
+        returns values representing membership degrees to all clauses
+
+    Examples
+    --------------------------------------------
+    >>> domain = Domain(0, 10, 0.01)
+    >>> ling_var = LinguisticVariable('Temperature', domain)
+    >>> low = Clause(ling_var, 'Low', Type1FuzzySet(lambda x: 1 - 0.1 * x))
+    >>> high = Clause(ling_var, 'High', Type1FuzzySet(lambda x: 0.1 * x))
+    >>> bank = ClauseBank([low, high])
+    >>> bank.get_values(2)
+    array([0.8, 0.2])
+    """
+
+    __slots__ = ('__values', '__metadata', '__indices', '__domain_min', '__domain_max', '__inv_precision')
+
+    def __init__(self, clauses: Sequence[Clause]):
+        """
+        Creates bank of clauses. All clauses must be defined on the same domain and their values must have
+        the same shape.
+
+        :param clauses: clauses to store
+        """
+        if not clauses:
+            raise ValueError('Clause bank requires at least one clause')
+        if not all(isinstance(clause, Clause) for clause in clauses):
+            raise TypeError('Clauses must be a Clause type')
+
+        domain = clauses[0].linguistic_variable.domain
+        bounds = (domain.min, domain.max, domain.precision)
+        for clause in clauses:
+            other = clause.linguistic_variable.domain
+            if (other.min, other.max, other.precision) != bounds:
+                raise ValueError('All clauses must be defined on the same domain')
+            if clause.values.shape != clauses[0].values.shape:
+                raise ValueError('Values of all clauses must have the same shape')
+
+        self.__values = np.stack([clause.values for clause in clauses]).astype(Clause.DTYPE, copy=False)
+        self.__values.setflags(write=False)
+        self.__metadata = [(clause.linguistic_variable, clause.gradation_adjective) for clause in clauses]
+        self.__indices = {clause: index for index, clause in enumerate(clauses)}
+        self.__domain_min = domain.min
+        self.__domain_max = domain.max
+        self.__inv_precision = 1.0 / domain.precision
+
+    def get_value(self, clause_index: int, x: Iterable[float] or float,
+                  validate: bool or None = None) -> MembershipDegree or Iterable[MembershipDegree]:
+        """
+        Returns a value representing membership degree to the clause of given index.
+
+        :param clause_index: index of clause in the bank
+        :param x: element of domain
+        :param validate: check if x is inside the domain, None uses Clause.VALIDATE_DOMAIN
+        :return: membership degree
+        """
+        return self.__values[clause_index, ..., self._find_index(x, validate)]
+
+    def get_values(self, x: Iterable[float] or float,
+                   validate: bool or None = None) -> Iterable[MembershipDegree]:
+        """
+        Returns values representing membership degrees to all clauses in the bank, i-th value for i-th clause.
+
+        :param x: element of domain
+        :param validate: check if x is inside the domain, None uses Clause.VALIDATE_DOMAIN
+        :return: membership degrees
+        """
+        return self.__values[..., self._find_index(x, validate)]
+
+    def index(self, clause: Clause) -> int:
+        """
+        Returns index of the clause in the bank.
+
+        :param clause: clause stored in the bank
+        :return: index of the clause
+        """
+        return self.__indices[clause]
+
+    def _find_index(self, x: Iterable[float] or float, validate: bool or None) -> int or Iterable[int]:
+        """
+        Returns the index of given x in the values table.
+
+        :param x: element of domain
+        :param validate: check if x is inside the domain, None uses Clause.VALIDATE_DOMAIN
+        :return: index of the element
+        """
+        if validate is None:
+            validate = Clause.VALIDATE_DOMAIN
+        return _find_domain_index(x, self.__domain_min, self.__domain_max, self.__inv_precision, validate)
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Getter of values of all clauses, i-th row holds values of i-th clause. Array is read-only.
+
+        :return: values of clauses on the domain
+        """
+        return self.__values
+
+    @property
+    def metadata(self) -> List[Tuple[LinguisticVariable, str]]:
+        """
+        Getter of linguistic variables and gradation adjectives of clauses, in the order of rows of values.
+
+        :return: list of pairs (linguistic variable, gradation adjective)
+        """
+        return self.__metadata
+
+    def __len__(self) -> int:
+        return len(self.__metadata)
+
+    def __str__(self) -> str:
+        return 'ClauseBank(' + ', '.join(f'{variable.name} is {adjective}'
+                                         for variable, adjective in self.__metadata) + ')'
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -1,6 +1,4 @@
-from collections.abc import Iterable
 import numpy as np
-from copy import deepcopy
 from fuzzyLib.knowledge.consequents.consequent import Consequent
 from fuzzyLib.knowledge.clause import Clause
 from fuzzyLib.fuzzySetsFol.fuzzy_set import MembershipDegree
@@ -18,11 +16,17 @@ class MamdaniConsequent(Consequent):
         supplies Consequent with universe and a fuzzy set
 
     __cut_clause : Clause
-        Clause with fuzzy set cut to the rule firing level
+        Clause with fuzzy set cut to the rule firing level by the last call of output
+
+    __buffer_clause : Clause
+        Clause created once and reused by every cut made with copy=False
+
+    __cut_values : np.ndarray or None
+        buffer holding values of the reused cut clause
 
     Methods
     --------------------------------------------
-    output(rule_firing: MembershipDegree) -> Clause
+    output(rule_firing: MembershipDegree, copy: bool = True) -> Clause
         Clause with fuzzy set cut to the rule firing level
 
     Examples:
@@ -48,6 +52,8 @@ class MamdaniConsequent(Consequent):
         """
         self.__clause = clause
         self.__cut_clause = None
+        self.__buffer_clause = None
+        self.__cut_values = None
 
     @property
     def clause(self) -> Clause:
@@ -65,7 +71,7 @@ class MamdaniConsequent(Consequent):
         """
         return self.__cut_clause
 
-    def output(self, rule_firing: MembershipDegree) -> Clause:
+    def output(self, rule_firing: MembershipDegree, copy: bool = True) -> Clause:
         """
         Cuts membership function to the level of rule firing. It is a minimum of membership function values
         and respecting rule firing. Rule firing should hold values from range [0, 1]. In case of interval type 2 fuzzy
@@ -74,27 +80,52 @@ class MamdaniConsequent(Consequent):
         Make sure type of fuzzy set used in Clause matches type of fuzzy sets used in Antecedent of Rule and therefore
         its firing type.
         :param rule_firing: firing value of a Rule in which Consequent is used
+        :param copy: return a new Clause, pass False to write the cut into one Clause reused by every call
+            with copy=False, its values are then overwritten by the next such call
         :return: Clause with fuzzy set cut to the rule firing level
         """
-        if isinstance(rule_firing, float):
-            return self.__cut(rule_firing)
-        elif isinstance(rule_firing, Iterable):
-            if not isinstance(rule_firing, np.ndarray):
-                rule_firing = np.array(rule_firing).reshape((len(rule_firing), 1))
-            if rule_firing.shape != (len(rule_firing), 1):
-                rule_firing = rule_firing.reshape(len(rule_firing), 1)
-            return self.__cut(rule_firing)
-        else:
+        if isinstance(rule_firing, (float, np.floating)):
+            return self.__cut(float(rule_firing), copy)
+        # collections are converted directly, np.asarray does not copy arrays of the type of clause values
+        try:
+            firing = np.asarray(rule_firing, dtype=self.__clause.values.dtype)
+        except (TypeError, ValueError):
+            firing = None
+        if firing is None or firing.ndim == 0:
             raise ValueError(f"Incorrect type of rule firing: {rule_firing}")
+        return self.__cut(firing.reshape(len(firing), 1), copy)
 
-    def __cut(self, rule_firing: np.ndarray or float) -> Clause:
+    def __cut(self, rule_firing: np.ndarray or float, copy: bool) -> Clause:
         """
         Makes a cut for type one fuzzy sets. If Clause fuzzy set type mismatches rule_firing type, exception is raised.
         :param rule_firing: crisp value of rule firing
+        :param copy: write the cut into new Clause instead of the reused one
         :return: Clause with fuzzy set cut to the rule firing level
         """
-        self.__cut_clause = deepcopy(self.__clause)
-        self.__cut_clause.values = np.minimum(self.__cut_clause.values, rule_firing)
+        values = self.__clause.values
+        # buffer keeps the type of clause values, firings are cast to it
+        dtype = values.dtype
+        if isinstance(rule_firing, float):
+            # scalar of the type of values leaves shape of values and lets minimum run without casting
+            rule_firing = dtype.type(rule_firing)
+            shape = values.shape
+        else:
+            shape = np.broadcast_shapes(values.shape, np.shape(rule_firing))
+        if copy:
+            # new clause reuses cached values of the fuzzy set, so only the cut is allocated
+            self.__cut_clause = Clause(self.__clause.linguistic_variable, self.__clause.gradation_adjective,
+                                       self.__clause.fuzzy_set)
+            self.__cut_clause.values = np.minimum(values, rule_firing)
+            return self.__cut_clause
+        # reused clause and its values buffer are created once, later cuts only write into the buffer
+        if self.__cut_values is None or self.__cut_values.shape != shape or self.__cut_values.dtype != dtype:
+            self.__cut_values = np.empty(shape, dtype=dtype)
+        if self.__buffer_clause is None:
+            self.__buffer_clause = Clause(self.__clause.linguistic_variable, self.__clause.gradation_adjective,
+                                          self.__clause.fuzzy_set)
+        np.minimum(values, rule_firing, out=self.__cut_values)
+        self.__buffer_clause.values = self.__cut_values
+        self.__cut_clause = self.__buffer_clause
         return self.__cut_clause
 
     def __str__(self):
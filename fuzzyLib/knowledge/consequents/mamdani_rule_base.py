@@ -0,0 +1,122 @@
+import numpy as np
+from typing import Sequence
+
+from fuzzyLib.knowledge.clause_bank import ClauseBank
+from fuzzyLib.knowledge.consequents.mamdani_consequent import MamdaniConsequent
+from fuzzyLib.fuzzySetsFol.fuzzy_set import MembershipDegree
+from fuzzyLib.utils import _kernels
+from fuzzyLib.utils._jit import NUMBA_AVAILABLE
+
+
+def batch_cut(values_matrix: np.ndarray, firings: np.ndarray, out: np.ndarray or None = None) -> np.ndarray:
+    """
+    Cuts values of many consequents to firing levels of their rules in one call. i-th row of values matrix is cut
+    to i-th firing.
+
+    :param values_matrix: values of consequent clauses, one row per rule
+    :param firings: firings of rules, one row per rule, without the domain axis
+    :param out: optional buffer of the shape of values matrix for the result
+    :return: cut values, one row per rule
+    """
+    firings = np.asarray(firings)
+    # firings get a trailing axis, so every firing is broadcast along the domain of its row
+    return np.minimum(values_matrix, firings.reshape(firings.shape + (1,)), out=out)
+
+
+class MamdaniRuleBase:
+    """
+    Class used to cut and aggregate consequents of many Mamdani rules defined on the same linguistic variable.
+    Values of all consequents are stacked into one array, so cutting all of them to firing levels of their rules
+    and aggregating the results by maximum are two vectorized calls instead of one cut per rule.
+
+    Attributes
+    --------------------------------------------
+    __consequents : Sequence[MamdaniConsequent]
+        consequents of rules, in the order of firings
+
+    __bank : ClauseBank
+        values of consequent clauses stacked one row per rule
+
+    __cut_values : np.ndarray or None
+        buffer holding values of all consequents cut to firing levels, not needed by the compiled kernel
+
+    __aggregated : np.ndarray
+        buffer holding maximum of cut values
+
+    Methods
+    --------------------------------------------
+    output(firings: Sequence[MembershipDegree]) -> np.ndarray
+        values of consequents cut to firings of rules and aggregated by maximum
+
+    Examples:
+    --------------------------------------------
+    >>> watering = LinguisticVariable('watering', Domain(0, 1, 0.001))
+    >>> low = MamdaniConsequent(Clause(watering, 'Low', Type1FuzzySet(gaussian(0.2, 0.1))))
+    >>> high = MamdaniConsequent(Clause(watering, 'High', Type1FuzzySet(gaussian(0.8, 0.1))))
+    >>> rule_base = MamdaniRuleBase([low, high])
+    >>> aggregated = rule_base.output([0.3, 0.6])
+    """
+
+    def __init__(self, consequents: Sequence[MamdaniConsequent]):
+        """
+        Creates rule base of given consequents. Clauses of all consequents must be defined on the same domain
+        and have fuzzy sets of the same type.
+
+        :param consequents: consequents of rules, in the order of firings passed to output
+        """
+        if not all(isinstance(consequent, MamdaniConsequent) for consequent in consequents):
+            raise TypeError('Consequents must be a MamdaniConsequent type')
+        self.__consequents = consequents
+        self.__bank = ClauseBank([consequent.clause for consequent in consequents])
+        values = self.__bank.values
+        self.__cut_values = None
+        self.__aggregated = np.empty_like(values[0])
+
+    def output(self, firings: Sequence[MembershipDegree]) -> np.ndarray:
+        """
+        Cuts values of consequents to firings of their rules and aggregates them by maximum.
+        In case of interval type 2 fuzzy sets every firing should be a two element collection of floats.
+        Returned array is reused by the next call, copy it to keep the result.
+
+        :param firings: firings of rules, i-th firing belongs to the rule of i-th consequent
+        :return: aggregated values on the domain of consequents
+        """
+        values = self.__bank.values
+        firings = np.asarray(firings, dtype=values.dtype)
+        if len(firings) != len(self.__consequents):
+            raise ValueError('Number of firings must match number of consequents')
+        if NUMBA_AVAILABLE and values.ndim in (2, 3):
+            # type 1 values get a bounds axis of length 1, so both types of fuzzy sets use one kernel
+            rules, domain_size = values.shape[0], values.shape[-1]
+            bounds = values.shape[1] if values.ndim == 3 else 1
+            _kernels.cut_and_aggregate(values.reshape(rules, bounds, domain_size), firings.reshape(rules, bounds),
+                                       self.__aggregated.reshape(bounds, domain_size))
+            return self.__aggregated
+        if self.__cut_values is None:
+            self.__cut_values = np.empty_like(values)
+        batch_cut(values, firings, out=self.__cut_values)
+        return self.__cut_values.max(axis=0, out=self.__aggregated)
+
+    @property
+    def consequents(self) -> Sequence[MamdaniConsequent]:
+        """
+        Getter of the consequents.
+
+        :return: consequents of rules
+        """
+        return self.__consequents
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Getter of values of consequent clauses, i-th row holds values of i-th consequent. Array is read-only.
+
+        :return: values of consequent clauses
+        """
+        return self.__bank.values
+
+    def __str__(self):
+        return 'MamdaniRuleBase(' + ', '.join(str(consequent) for consequent in self.__consequents) + ')'
+
+    def __repr__(self):
+        return self.__str__()
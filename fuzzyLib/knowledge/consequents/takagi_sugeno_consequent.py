@@ -1,4 +1,7 @@
-from typing import NoReturn, Dict
+from types import MappingProxyType
+from typing import NoReturn, Dict, List, Mapping
+
+import numpy as np
 
 from fuzzyLib.knowledge.linguistic_variable import LinguisticVariable
 from fuzzyLib.knowledge.consequents.consequent import Consequent
@@ -12,6 +15,10 @@ class TakagiSugenoConsequent(Consequent):
         --------------------------------------------
         __function_parameters : Dict[LinguisticVariable, float]
             supplies parameters to consequent output function, which takes form y = ax1 + bx2 + ...
+        __weights : np.ndarray
+            parameters of consequent function as an array, in the order of __variable_order
+        __variable_order : List[LinguisticVariable]
+            order of input variables matching __weights
         __bias : float
         __consequent_output : float
             represents crisp output value of consequent function
@@ -24,6 +31,9 @@ class TakagiSugenoConsequent(Consequent):
             value representing output from calculating consequent function with provided
              input parameters
 
+        output_batch: np.ndarray
+            values of consequent function for many samples given as rows of an array
+
         Examples:
         --------------------------------------------
         domain = Domain(0, 10, 0.01)
@@ -44,18 +54,21 @@ class TakagiSugenoConsequent(Consequent):
          bias: value representing constant in consequent function
          linguistic_variable: represent attribute of output inference
         """
-        self.__function_parameters = function_parameters
+        # own copy, so parameters can not change without the cached weights
+        self.__function_parameters = dict(function_parameters)
+        self._cache_parameters()
         self.__linguistic_variable = linguistic_variable
         self.__consequent_output = 0
         self.__bias = bias
 
     @property
-    def function_parameters(self) -> Dict[LinguisticVariable, float]:
+    def function_parameters(self) -> Mapping[LinguisticVariable, float]:
         """
-        Getter of function parameters
+        Getter of function parameters. Returned mapping is read-only, as output uses weights cached from it,
+        assign a new dictionary to change the parameters.
         :return: function_parameters
         """
-        return self.__function_parameters
+        return MappingProxyType(self.__function_parameters)
 
     @function_parameters.setter
     def function_parameters(self, new_function_parameters: Dict[LinguisticVariable, float]) -> NoReturn:
@@ -64,11 +77,42 @@ class TakagiSugenoConsequent(Consequent):
         :param new_function_parameters: new dictionary of consequent's function parameters
         :return: NoReturn
         """
-        if (not isinstance(new_function_parameters, dict) or
-                not all(isinstance(x, float) or isinstance(x, int) for x in new_function_parameters.values()) or
-                not all(isinstance(x, LinguisticVariable) for x in new_function_parameters.keys())):
+        if (not isinstance(new_function_parameters, (dict, MappingProxyType)) or
+                not all(isinstance(x, LinguisticVariable) for x in new_function_parameters)):
+            raise ValueError("Takagi-Sugeno consequent parameters must be Dict[LinguisticVariable, float]!")
+        # values are converted in one pass, anything which is not a finite number is rejected,
+        # including strings, which np.fromiter would parse
+        try:
+            weights = np.fromiter(new_function_parameters.values(), dtype=np.float64,
+                                  count=len(new_function_parameters))
+        except (TypeError, ValueError):
+            weights = None
+        if (weights is None or not np.isfinite(weights).all() or
+                any(isinstance(x, (str, bytes)) for x in new_function_parameters.values())):
             raise ValueError("Takagi-Sugeno consequent parameters must be Dict[LinguisticVariable, float]!")
-        self.__function_parameters = new_function_parameters
+        self.__function_parameters = dict(new_function_parameters)
+        self._cache_parameters(weights)
+
+    def _cache_parameters(self, weights: np.ndarray or None = None) -> NoReturn:
+        """
+        Stores function parameters as an array in a fixed order of input variables, so output is a dot product
+        instead of a loop over the dictionary.
+        :param weights: parameters already converted in the order of the dictionary, None to convert them
+        :return: NoReturn
+        """
+        self.__variable_order = list(self.__function_parameters.keys())
+        if weights is None:
+            weights = np.fromiter((self.__function_parameters[key] for key in self.__variable_order),
+                                  dtype=np.float64, count=len(self.__variable_order))
+        self.__weights = weights
+
+    @property
+    def variable_order(self) -> List[LinguisticVariable]:
+        """
+        Getter of order of input variables, columns of output_batch input must follow it
+        :return: list of input linguistic variables
+        """
+        return self.__variable_order
 
     @property
     def bias(self) -> float:
@@ -117,13 +161,21 @@ class TakagiSugenoConsequent(Consequent):
                 corresponding function parameter provided.
         :return: name of feature and crisp rule output value that needs to be used in aggregation process
         """
-        self.__consequent_output = self.__bias
         try:
-            for key in self.__function_parameters:
-                self.__consequent_output += consequent_input[key] * self.__function_parameters[key]
-            return self.__consequent_output
-        except KeyError:
-            raise KeyError("Function parameters contain value for input {0} which was not provided!".format(key.name))
+            inputs = [consequent_input[key] for key in self.__variable_order]
+        except KeyError as error:
+            raise KeyError("Function parameters contain value for input {0} which was not provided!"
+                           .format(error.args[0].name))
+        self.__consequent_output = np.dot(self.__weights, np.asarray(inputs, dtype=np.float64)) + self.__bias
+        return self.__consequent_output
+
+    def output_batch(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Return rule output levels for many samples at once.
+        :param inputs: array of shape (samples, features), columns follow variable_order
+        :return: crisp rule output value for every sample
+        """
+        return np.asarray(inputs, dtype=np.float64) @ self.__weights + self.__bias
 
     def __str__(self):
         return "TakagiSugenoConsequent_" + self.linguistic_variable.name + '_' + str(self.bias)
@@ -1,7 +1,32 @@
+from math import ceil
 from typing import Sequence
 
 import numpy as np
 
+from fuzzyLib.fuzzySetsFol.fuzzy_set import FuzzySet
+from fuzzyLib.fuzzySetsFol.type1_fuzzy_set import Type1FuzzySet
+from fuzzyLib.fuzzySetsFol.interval_type2_fuzzy_set import IntervalType2FuzzySet
+from fuzzyLib.utils.membership_functions.membership_functions import gaussian_parameters, gaussians
+
+
+def _gaussian_parameters(fuzzy_set: FuzzySet):
+    """
+    Returns parameters of gaussian membership functions of fuzzy set.
+
+    :param fuzzy_set: fuzzy set
+    :return: (mean, sigma, max_value) for type I fuzzy set, ((mean, sigma, max_value), (mean, sigma, max_value))
+        of lower and upper membership functions for interval type II fuzzy set,
+        None if membership functions are not gaussian
+    """
+    if type(fuzzy_set) is Type1FuzzySet:
+        return gaussian_parameters(fuzzy_set.membership_function)
+    if type(fuzzy_set) is IntervalType2FuzzySet:
+        lower = gaussian_parameters(fuzzy_set.lower_membership_function)
+        upper = gaussian_parameters(fuzzy_set.upper_membership_function)
+        if lower is not None and upper is not None:
+            return lower, upper
+    return None
+
 
 class Domain:
     """
@@ -16,13 +41,25 @@ class Domain:
         a maximum value in the domain
     __precision : float
         a precision of the domain
+    __size : int
+        number of points of the domain
+    __values : np.ndarray or None
+        the domain as sequence, materialized on first call
             
     Methods
     --------------------------------------------
-    domain -> Sequence[float]
-        Returns sequence from assigned intervals and precision
+    __call__() -> Sequence[float]
+        Returns sequence from assigned intervals and precision. The sequence is cached and read-only,
+        code that modifies it must work on a copy
+
+    clone() -> Domain
+        Returns a new domain with the same bounds and precision
+
+    Domain is immutable, so one instance can be shared by many linguistic variables.
     """
 
+    __slots__ = ('__min_value', '__max_value', '__precision', '__size', '__values')
+
     def __init__(self, min_value: float, max_value: float, precision: float):
         """
         Creates a domain.
@@ -34,6 +71,10 @@ class Domain:
         self.__min_value = min_value
         self.__max_value = max_value
         self.__precision = precision
+        # number of points matches np.arange(min, max, precision), a range which is not a whole number of steps
+        # keeps its last partial step. Tolerance stops rounding of the step from adding a point at max
+        self.__size = int(ceil((max_value - min_value) / precision - 1e-9))
+        self.__values = None
 
     @property
     def precision(self) -> float:
@@ -46,11 +87,44 @@ class Domain:
 
     def __call__(self) -> Sequence[float]:
         """
-        Creates a sequence matching given range and precision.
+        Creates a sequence matching given range and precision.\n
+        The sequence is created on the first call and shared by later calls, so clauses and linguistic variables
+        on the same domain do not allocate it again. Returned array is read-only.
 
         :return: the domain as sequence of floats
         """
-        return np.arange(self.min, self.max, self.precision)
+        if self.__values is None:
+            values = np.linspace(self.__min_value, self.__min_value + self.__size * self.__precision, self.__size,
+                                 endpoint=False)
+            values.setflags(write=False)
+            self.__values = values
+        return self.__values
+
+    def clone(self) -> 'Domain':
+        """
+        Creates a new domain with the same bounds and precision, which does not share the cached sequence.
+
+        :return: copy of the domain
+        """
+        return Domain(self.__min_value, self.__max_value, self.__precision)
+
+    @property
+    def size(self) -> int:
+        """
+        Returns number of points of the domain.
+
+        :return: number of points
+        """
+        return self.__size
+
+    @property
+    def last(self) -> float:
+        """
+        Returns the last point of the domain, which is the last point before maximum on the grid of given precision.
+
+        :return: last point
+        """
+        return self.__min_value + (self.__size - 1) * self.__precision
 
     @property
     def min(self) -> float:
@@ -123,6 +197,26 @@ class LinguisticVariable:
         """
         return self.__name
 
+    def bulk_evaluate(self, fuzzy_sets: Sequence[FuzzySet]) -> np.ndarray:
+        """
+        Evaluates fuzzy sets on the domain of the linguistic variable.\n
+        If all of them are type I fuzzy sets with gaussian membership functions, or all are interval type II fuzzy
+        sets with gaussian lower and upper membership functions, they are evaluated together in one broadcast
+        expression. Otherwise every fuzzy set is evaluated separately.
+
+        :param fuzzy_sets: fuzzy sets to evaluate
+        :return: array in which i-th row holds values of i-th fuzzy set on the domain
+        """
+        domain = self.__domain()
+        parameters = [_gaussian_parameters(fuzzy_set) for fuzzy_set in fuzzy_sets]
+        if parameters and all(parameter is not None for parameter in parameters):
+            parameters = np.asarray(parameters, dtype=np.float64)
+            if parameters.ndim == 2:
+                return gaussians(parameters, domain)
+            # interval type II sets are evaluated as 2K gausses and split back into (K, 2, D)
+            return gaussians(parameters.reshape(-1, 3), domain).reshape(len(fuzzy_sets), 2, len(domain))
+        return np.stack([np.asarray(fuzzy_set(domain)) for fuzzy_set in fuzzy_sets])
+
     def __str__(self):
         return self.name + '_' + str(self.domain)
 
@@ -6,8 +6,6 @@ from fuzzyLib.fuzzySetsFol.fuzzy_set import MembershipDegree
 from fuzzyLib.knowledge.clause import Clause
 from fuzzyLib.knowledge.antecedent import Antecedent
 
-from functools import partial
-
 
 class Term(Antecedent):
     """
@@ -27,6 +25,14 @@ class Term(Antecedent):
     Examples
     --------------------------------------------
     """
+    MEMOIZE_FIRING = False
+    """
+    If True, terms combined with & and | remember the last input dictionary and its firing value, so a sub-term
+    shared by many rules is evaluated once per input. Every inference step must pass a new dictionary, which is not
+    modified later, otherwise a stale firing value is returned. Applies to terms created after setting it.
+    """
+
+    __slots__ = ('name', '__fire', '__operations', '__cached_input', '__cached_firing')
 
     def __init__(self, algebra: Algebra, clause: Clause = None, name: str = None):
         """
@@ -36,6 +42,9 @@ class Term(Antecedent):
         :param name: name of the term
         """
         super().__init__(algebra)
+        self.__operations = None
+        self.__cached_input = None
+        self.__cached_firing = None
 
         if not clause:
             self.__fire = None
@@ -48,10 +57,10 @@ class Term(Antecedent):
                 self.name = clause.linguistic_variable.name + '_' + clause.gradation_adjective
             else:
                 self.name = name
-            self.__fire = partial(self.dict_clause, clause=clause)
-
-    def dict_clause(self, dict_ : dict[Clause, MembershipDegree], clause: Clause):
-        return dict_[clause]
+            def fire(dict_: Dict[Clause, MembershipDegree]) -> MembershipDegree:
+                return dict_[clause]
+            self.__fire = fire
+            self.__operations = (fire, ())
 
     @property
     def fire(self) -> Callable[[Dict[Clause, MembershipDegree]], MembershipDegree]:
@@ -59,8 +68,7 @@ class Term(Antecedent):
         Returns the firing function.
         :return: firing function
         
-        It return the partial function dict_clause with set clause argument. That is why it return the function
-        that after passing Dict[Clause, MembershipDegree] return MembershipDegree
+        It returns the function that after passing Dict[Clause, MembershipDegree] returns MembershipDegree
         """
         return self.__fire
 
@@ -71,11 +79,33 @@ class Term(Antecedent):
 
         :param fire: firing function
         """
+        if Term.MEMOIZE_FIRING:
+            fire = self.__memoize(fire)
         self.__fire = fire
+        self.__operations = None
+
+    def __memoize(self, fire: Callable[[Dict[Clause, MembershipDegree]], MembershipDegree]) \
+            -> Callable[[Dict[Clause, MembershipDegree]], MembershipDegree]:
+        """
+        Wraps firing function, so it is computed once for consecutive calls with the same dictionary.
+        The dictionary itself is kept and compared by identity, so its id can not be reused by another dictionary.
+
+        :param fire: firing function
+        :return: memoized firing function
+        """
+        def memoized_fire(dict_: Dict[Clause, MembershipDegree]) -> MembershipDegree:
+            if self.__cached_input is dict_:
+                return self.__cached_firing
+            firing = fire(dict_)
+            self.__cached_input = dict_
+            self.__cached_firing = firing
+            return firing
+        return memoized_fire
 
     def __and__(self, other: Term) -> Term:
         """
         Creates new antecedent object and sets new firing function which uses t-norm.
+        Firing functions of both terms are taken when the new term is created, so they must be set before.
         We create new term using t_norm operator between self: Term and the other: Term
         example:
         "temperature is high and humidity is low "
@@ -83,16 +113,12 @@ class Term(Antecedent):
         :param other: other term
         :return: term
         """
-        new_term = self.__class__(self.algebra, name=self.name + ' & ' + other.name)
-        # Sprawdzić czy działa
-
-        # now new fire is the partial of apply_dict_t_norm that also takes as arguments Dict[Clause, MembershipDegree]
-        new_term.fire = partial(self.apply_dict_t_norm, other=other)
-        return new_term
+        return self.__combine(other, self.t_norm, ' & ')
 
     def __or__(self, other: Term) -> Term:
         """
         Creates new antecedent object and sets new firing function which uses s-norm.
+        Firing functions of both terms are taken when the new term is created, so they must be set before.
         We create new term using s_norm operator between self: Term and the other: Term
         example:
         "temperature is high or humidity is low "
@@ -102,9 +128,35 @@ class Term(Antecedent):
         :param other: other term
         :return: term
         """
-        new_term = self.__class__(self.algebra, name=self.name + ' | ' + other.name)
-        # Sprawdzić czy działa
-        new_term.fire = partial(self.apply_dict_s_norm, other=other)
+        return self.__combine(other, self.s_norm, ' | ')
+
+    def __combine(self, other: Term, norm: Callable[[MembershipDegree, MembershipDegree], MembershipDegree],
+                  symbol: str) -> Term:
+        """
+        Creates new term which fires as norm of firings of both terms.
+        Chains like A & B | C are kept flat, as the first firing function and a sequence of (norm, firing function)
+        pairs, so firing goes through them in one loop instead of one nested call per operator.
+        Memoized terms are not flattened, so firing of a shared sub-term is still computed once.
+
+        :param other: other term
+        :param norm: t-norm or s-norm of the algebra
+        :param symbol: symbol of the operator used in the name of new term
+        :return: term
+        """
+        new_term = self.__class__(self.algebra, name=self.name + symbol + other.name)
+        if self.__operations is None or Term.MEMOIZE_FIRING:
+            first, operations = self.fire, ()
+        else:
+            first, operations = self.__operations
+        operations = operations + ((norm, other.fire),)
+
+        def fire(dict_: Dict[Clause, MembershipDegree]) -> MembershipDegree:
+            firing = first(dict_)
+            for operation, operand in operations:
+                firing = operation(firing, operand(dict_))
+            return firing
+        new_term.fire = fire
+        new_term.__operations = (first, operations)
         return new_term
 
     def __str__(self):
@@ -112,9 +164,3 @@ class Term(Antecedent):
 
     def __repr__(self):
         return self.__str__()
-
-    def apply_dict_t_norm(self, dict_, other):
-        return self.algebra.t_norm(self.fire(dict_), other.fire(dict_))
-
-    def apply_dict_s_norm(self, dict_, other):
-        return self.algebra.s_norm(self.fire(dict_), other.fire(dict_))
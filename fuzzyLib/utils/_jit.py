@@ -0,0 +1,18 @@
+"""
+Optional numba support.\n
+Numba is not a required dependency of the library. If it is not installed, njit and vectorize leave functions as they
+are and callers should check NUMBA_AVAILABLE before choosing compiled kernels over their numpy counterparts.
+"""
+try:
+    from numba import njit, prange, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+    vectorize = njit
@@ -0,0 +1,25 @@
+"""
+Compiled kernels used by rule bases.
+"""
+from fuzzyLib.utils._jit import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cut_and_aggregate(values, firings, out):
+    """
+    Cuts values of r-th consequent to r-th firing and takes maximum over consequents in a single pass.
+
+    :param values: values of consequents of shape (rules, bounds, domain)
+    :param firings: firings of rules of shape (rules, bounds)
+    :param out: output array of shape (bounds, domain)
+    :return: out
+    """
+    for i in prange(values.shape[2]):
+        for j in range(values.shape[1]):
+            aggregated = 0.0
+            for r in range(values.shape[0]):
+                value = min(values[r, j, i], firings[r, j])
+                if value > aggregated:
+                    aggregated = value
+            out[j, i] = aggregated
+    return out
@@ -0,0 +1,11 @@
+"""
+Optional numexpr support.\n
+Numexpr is not a required dependency of the library. If it is not installed, callers should check NUMEXPR_AVAILABLE
+and evaluate their expressions with numpy instead.
+"""
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    numexpr = None
+    NUMEXPR_AVAILABLE = False
@@ -1,7 +1,9 @@
-from doggos.knowledge import LinguisticVariable, Clause, Domain
-from doggos.fuzzy_sets import Type1FuzzySet, IntervalType2FuzzySet
-from doggos.fuzzy_sets.fuzzy_set import FuzzySet
-from doggos.utils.membership_functions import generate_equal_gausses, \
+from fuzzyLib.knowledge.linguistic_variable import LinguisticVariable, Domain
+from fuzzyLib.knowledge.clause import Clause
+from fuzzyLib.fuzzySetsFol.type1_fuzzy_set import Type1FuzzySet
+from fuzzyLib.fuzzySetsFol.interval_type2_fuzzy_set import IntervalType2FuzzySet
+from fuzzyLib.fuzzySetsFol.fuzzy_set import FuzzySet
+from fuzzyLib.utils.membership_functions.membership_functions import generate_equal_gausses, \
     generate_progressive_gausses, \
     generate_even_triangulars, \
     generate_full_triangulars, \
@@ -9,16 +11,28 @@ from doggos.utils.membership_functions import generate_equal_gausses, \
     generate_full_trapezoidals, sigmoid
 
 from typing import Sequence, List, Tuple, Iterable, Dict
-from copy import deepcopy, copy
 
+_GRAD_ADJS = {
+    2: ('Zero', 'One'),
+    3: ('Low', 'Medium', 'High'),
+    5: ('Low', 'Medium_Low', 'Medium', 'Medium_High', 'High'),
+    7: ('Low', 'Medium_Low_Minus', 'Medium_Low', 'Medium', 'Medium_High', 'Medium_High_Plus', 'High'),
+    9: ('Low', 'Medium_Low_Minus', 'Medium_Low', 'Medium_Low_Plus', 'Medium', 'Medium_High_Minus',
+        'Medium_High', 'Medium_High_Plus', 'High'),
+    11: ('Low', 'Low_High', 'Medium_Low_Minus', 'Medium_Low', 'Medium_Low_Plus', 'Medium',
+         'Medium_High_Minus', 'Medium_High', 'Medium_High_Plus', 'High_Low', 'High'),
+}
+"""
+Gradation adjectives of fuzzy sets created for a linguistic variable, keyed by number of membership functions.
+"""
 
 def create_gausses_t1(n_mfs, middle_val=0.5, domain: Domain = Domain(0, 1.001, 0.001), mode: str = 'equal', adjustment='center', mean=0.5):
     if mode == 'equal' or mode == 'default':
-        fuzzy_sets = generate_equal_gausses(n_mfs, domain.min, domain.max - domain.precision)
+        fuzzy_sets = generate_equal_gausses(n_mfs, domain.min, domain.last)
     elif mode == 'progressive':
         fuzzy_sets = generate_progressive_gausses(n_mfs, middle_val)
     else:
-        raise NotImplemented(f'Gaussian fuzzy sets mode can be either equal or progressive, not {mode}')
+        raise NotImplementedError(f'Gaussian fuzzy sets mode can be either equal or progressive, not {mode}')
     return fuzzy_sets
 
 
@@ -29,88 +43,81 @@ def create_sigmoids_t1(offset=0.5, magnitude=5):
 
 
 def create_triangular_t1(n_mfs, domain: Domain = Domain(0, 1.001, 0.001), mode: str = 'equal'):
+    start, end = domain.min, domain.last
     if mode == 'equal' or mode == 'default':
-        fuzzy_sets = generate_even_triangulars(n_mfs, domain.min, domain.max - domain.precision)
+        fuzzy_sets = generate_even_triangulars(n_mfs, start, end)
     elif mode == 'full':
-        fuzzy_sets = generate_full_triangulars(n_mfs, domain.min, domain.max - domain.precision)
+        fuzzy_sets = generate_full_triangulars(n_mfs, start, end)
     else:
-        raise NotImplemented(f'Triangular fuzzy sets mode can be either even or full, not {mode}')
+        raise NotImplementedError(f'Triangular fuzzy sets mode can be either even or full, not {mode}')
     return fuzzy_sets
 
 
 def create_trapezoidal_t1(n_mfs, domain: Domain = Domain(0, 1.001, 0.001), mode: str = 'equal'):
+    start, end = domain.min, domain.last
     if mode == 'equal' or mode == 'default':
-        fuzzy_sets = generate_even_trapezoidals(n_mfs, domain.min, domain.max - domain.precision)
+        fuzzy_sets = generate_even_trapezoidals(n_mfs, start, end)
     elif mode == 'full':
-        fuzzy_sets = generate_full_trapezoidals(n_mfs, domain.min, domain.max - domain.precision)
+        fuzzy_sets = generate_full_trapezoidals(n_mfs, start, end)
     else:
-        raise NotImplemented(f'Trapezoidal fuzzy sets mode can be either even or full, not {mode}')
+        raise NotImplementedError(f'Trapezoidal fuzzy sets mode can be either even or full, not {mode}')
     return fuzzy_sets
 
 
 def create_gausses_it2(n_mfs, middle_val=0.5, domain: Domain = Domain(0, 1.001, 0.001), mode: str = 'equal',
-                       lower_scaling: float = 0.8, adjustment='center', mid_ev=0.5):
+                       lower_scaling: float = 0.8, adjustment='center', mid_ev=0.5, return_params: bool = False):
     if mode == 'equal' or mode == 'default':
-        if adjustment == 'center':
-            upper_fuzzy_sets = generate_equal_gausses(n_mfs, domain.min, domain.max - domain.precision)
-            lower_fuzzy_sets = generate_equal_gausses(n_mfs, domain.min, domain.max - domain.precision, lower_scaling)
-        elif adjustment == 'mean':
-            upper_fuzzy_sets = generate_equal_gausses(n_mfs, domain.min, domain.max - domain.precision, mid_ev=middle_val)
-            lower_fuzzy_sets = generate_equal_gausses(n_mfs, domain.min, domain.max - domain.precision, lower_scaling, mid_ev=middle_val)
+        start, end = domain.min, domain.last
+        # mean adjustment only moves expected value of the gausses, both bounds are created the same way
+        kwargs = {'mid_ev': middle_val} if adjustment == 'mean' else {}
+        upper_fuzzy_sets = generate_equal_gausses(n_mfs, start, end, return_params=return_params, **kwargs)
+        lower_fuzzy_sets = generate_equal_gausses(n_mfs, start, end, lower_scaling, return_params=return_params,
+                                                  **kwargs)
+        if return_params:
+            # rows (mean, sigma, max_value) of lower and upper gausses, evaluated together with gaussians
+            return lower_fuzzy_sets, upper_fuzzy_sets
+    elif return_params:
+        raise ValueError('Parameters can be returned only for gausses created in equal mode')
     elif mode == 'progressive':
-        if adjustment == 'center':
-            upper_fuzzy_sets = generate_progressive_gausses(n_mfs, middle_val)
-            lower_fuzzy_sets = generate_progressive_gausses(n_mfs, middle_val, lower_scaling)
-        elif adjustment == 'mean':
-            upper_fuzzy_sets = generate_progressive_gausses(n_mfs, middle_val)
-            lower_fuzzy_sets = generate_progressive_gausses(n_mfs, middle_val, lower_scaling)
+        upper_fuzzy_sets = generate_progressive_gausses(n_mfs, middle_val)
+        lower_fuzzy_sets = generate_progressive_gausses(n_mfs, middle_val, lower_scaling)
     else:
-        raise NotImplemented(f'Gaussian fuzzy sets mode can be either equal or progressive, not {mode}')
-    functions = []
-    for lmf, umf in zip(lower_fuzzy_sets, upper_fuzzy_sets):
-        functions.append((lmf, umf))
-    return functions
+        raise NotImplementedError(f'Gaussian fuzzy sets mode can be either equal or progressive, not {mode}')
+    return list(zip(lower_fuzzy_sets, upper_fuzzy_sets))
 
 
 def create_triangular_it2(n_mfs, domain: Domain = Domain(0, 1.001, 0.001), mode: str = 'equal',
                           lower_scaling: float = 0.8):
+    start, end = domain.min, domain.last
     if mode == 'equal' or mode == 'default':
-        upper_fuzzy_sets = generate_even_triangulars(n_mfs, domain.min, domain.max - domain.precision)
-        lower_fuzzy_sets = generate_even_triangulars(n_mfs, domain.min, domain.max - domain.precision, lower_scaling)
+        upper_fuzzy_sets = generate_even_triangulars(n_mfs, start, end)
+        lower_fuzzy_sets = generate_even_triangulars(n_mfs, start, end, lower_scaling)
     elif mode == 'full':
-        upper_fuzzy_sets = generate_full_triangulars(n_mfs, domain.min, domain.max - domain.precision)
-        lower_fuzzy_sets = generate_full_triangulars(n_mfs, domain.min, domain.max - domain.precision, lower_scaling)
+        upper_fuzzy_sets = generate_full_triangulars(n_mfs, start, end)
+        lower_fuzzy_sets = generate_full_triangulars(n_mfs, start, end, lower_scaling)
     else:
-        raise NotImplemented(f'Triangular fuzzy sets mode can be either even or full, not {mode}')
-    functions = []
-    for lmf, umf in zip(lower_fuzzy_sets, upper_fuzzy_sets):
-        functions.append((lmf, umf))
-    return functions
+        raise NotImplementedError(f'Triangular fuzzy sets mode can be either even or full, not {mode}')
+    return list(zip(lower_fuzzy_sets, upper_fuzzy_sets))
 
 
 def create_trapezoidal_it2(n_mfs, domain: Domain = Domain(0, 1.001, 0.001), mode: str = 'equal',
                            lower_scaling: float = 0.8):
+    start, end = domain.min, domain.last
     if mode == 'equal' or mode == 'default':
-        upper_fuzzy_sets = generate_even_trapezoidals(n_mfs, domain.min, domain.max - domain.precision)
-        lower_fuzzy_sets = generate_even_trapezoidals(n_mfs, domain.min, domain.max - domain.precision, lower_scaling)
+        upper_fuzzy_sets = generate_even_trapezoidals(n_mfs, start, end)
+        lower_fuzzy_sets = generate_even_trapezoidals(n_mfs, start, end, lower_scaling)
     elif mode == 'full':
-        upper_fuzzy_sets = generate_full_trapezoidals(n_mfs, domain.min, domain.max - domain.precision)
-        lower_fuzzy_sets = generate_full_trapezoidals(n_mfs, domain.min, domain.max - domain.precision, lower_scaling)
+        upper_fuzzy_sets = generate_full_trapezoidals(n_mfs, start, end)
+        lower_fuzzy_sets = generate_full_trapezoidals(n_mfs, start, end, lower_scaling)
     else:
-        raise NotImplemented(f'Trapezoidal fuzzy sets mode can be either even or full, not {mode}')
-    functions = []
-    for lmf, umf in zip(lower_fuzzy_sets, upper_fuzzy_sets):
-        functions.append((lmf, umf))
-    return functions
+        raise NotImplementedError(f'Trapezoidal fuzzy sets mode can be either even or full, not {mode}')
+    return list(zip(lower_fuzzy_sets, upper_fuzzy_sets))
 
 
 def create_sigmoids_it2(offset=0.5, magnitude=5, lower_scaling: float = 0.8):
     upper_fuzzy_sets = [sigmoid(offset, -magnitude), sigmoid(offset, magnitude)]
     lower_fuzzy_sets = [sigmoid(offset, -magnitude, lower_scaling), sigmoid(offset, magnitude, lower_scaling)]
-    functions = []
-    for lmf, umf in zip(lower_fuzzy_sets, upper_fuzzy_sets):
-        functions.append((lmf, umf))
-    return functions
+    return list(zip(lower_fuzzy_sets, upper_fuzzy_sets))
 
 
 
@@ -149,7 +156,7 @@ def create_set_of_variables(ling_var_names: Iterable[str],
             elif mf_type == 'sigmoid':
                 membership_functions = create_sigmoids_t1()
             else:
-                raise NotImplemented(f"mf_type of type {mf_type} is not yet implemented.")
+                raise NotImplementedError(f"mf_type of type {mf_type} is not yet implemented.")
 
         elif fuzzy_set_type == 'it2':
             if mf_type == 'gaussian':
@@ -164,18 +171,29 @@ def create_set_of_variables(ling_var_names: Iterable[str],
             elif mf_type == 'sigmoid':
                 membership_functions = create_sigmoids_it2(lower_scaling=lower_scaling)
             else:
-                raise NotImplemented(f"mf_type of type {mf_type} is not yet implemented.")
+                raise NotImplementedError(f"mf_type of type {mf_type} is not yet implemented.")
 
         return membership_functions
 
-    def __create_fuzzy_sets(membership_functions, fuzzy_sets):
+    def __create_fuzzy_sets(var, membership_functions, fuzzy_sets):
+        # membership functions are shared by all variables, so they stay a list and are not consumed here
+        var_fuzzy_sets = fuzzy_sets[var]
         if isinstance(membership_functions[0], tuple):
-            for adj, mfs in zip(grad_adjs, membership_functions):
-                lmf, umf = mfs
-                fuzzy_sets[var].update({adj: IntervalType2FuzzySet(lmf, umf)})
+            for adj, (lmf, umf) in zip(grad_adjs, membership_functions):
+                var_fuzzy_sets[adj] = IntervalType2FuzzySet(lmf, umf)
         else:
             for adj, mf in zip(grad_adjs, membership_functions):
-                fuzzy_sets[var].update({adj: Type1FuzzySet(mf)})
+                var_fuzzy_sets[adj] = Type1FuzzySet(mf)
+        return fuzzy_sets
+
+    def __create_fuzzy_sets_per_variable(fuzzy_sets):
+        # membership functions are created again only when middle value changes, equal values share them
+        previous_middle_val, membership_functions = None, None
+        for var, middle_val in zip(ling_var_names, middle_vals):
+            if membership_functions is None or middle_val != previous_middle_val:
+                membership_functions = __create_membership_functions(middle_val)
+                previous_middle_val = middle_val
+            fuzzy_sets = __create_fuzzy_sets(var, membership_functions, fuzzy_sets)
         return fuzzy_sets
 
     if mode == 'progressive' and mf_type != 'gaussian':
@@ -183,43 +201,27 @@ def create_set_of_variables(ling_var_names: Iterable[str],
     fuzzy_sets = {}
     ling_vars = []
     for var in ling_var_names:
-        ling_vars.append(LinguisticVariable(var, deepcopy(domain)))
+        ling_vars.append(LinguisticVariable(var, domain))
         fuzzy_sets[var] = {}
 
-    if n_mfs == 2:
-        grad_adjs = ['Zero', 'One']
-    elif n_mfs == 3:
-        grad_adjs = ['Low', 'Medium', 'High']
-    elif n_mfs == 5:
-        grad_adjs = ['Low', 'Medium_Low', 'Medium', 'Medium_High', 'High']
-    elif n_mfs == 7:
-        grad_adjs = ['Low', 'Medium_Low_Minus', 'Medium_Low', 'Medium', 'Medium_High', 'Medium_High_Plus', 'High']
-    elif n_mfs == 9:
-        grad_adjs = ['Low', 'Medium_Low_Minus', 'Medium_Low', 'Medium_Low_Plus', 'Medium', 'Medium_High_Minus',
-                     'Medium_High', 'Medium_High_Plus', 'High']
-    elif n_mfs == 11:
-        grad_adjs = ['Low', 'Low_High', 'Medium_Low_Minus', 'Medium_Low', 'Medium_Low_Plus', 'Medium',
-                     'Medium_High_Minus', 'Medium_High', 'Medium_High_Plus', 'High_Low', 'High']
-    else:
-        raise NotImplemented('n_mfs must have value from set {2, 3, 5, 7, 9, 11}')
+    try:
+        grad_adjs = _GRAD_ADJS[n_mfs]
+    except KeyError:
+        raise NotImplementedError('n_mfs must have value from set {2, 3, 5, 7, 9, 11}')
 
     if adjustment == 'mean':
         if hasattr(middle_vals, '__iter__'):
-            for var, middle_val in zip(ling_var_names, middle_vals):
-                membership_functions = __create_membership_functions(middle_val)
-                fuzzy_sets = __create_fuzzy_sets(membership_functions, fuzzy_sets)
+            fuzzy_sets = __create_fuzzy_sets_per_variable(fuzzy_sets)
         else:
             raise Exception(f"Adjustment mean, but middle_vals is not Iterable")
     else:
         if mode != 'progressive':
             membership_functions = __create_membership_functions()
             for var in ling_var_names:
-                fuzzy_sets = __create_fuzzy_sets(membership_functions, fuzzy_sets)
+                fuzzy_sets = __create_fuzzy_sets(var, membership_functions, fuzzy_sets)
         else:
             if hasattr(middle_vals, '__iter__'):
-                for var, middle_val, mid_ev in zip(ling_var_names, middle_vals):
-                    membership_functions = __create_membership_functions(middle_val)
-                    fuzzy_sets = __create_fuzzy_sets(membership_functions, fuzzy_sets)
+                fuzzy_sets = __create_fuzzy_sets_per_variable(fuzzy_sets)
 
     clauses = {}
     for var in ling_vars:
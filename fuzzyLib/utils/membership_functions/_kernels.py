@@ -0,0 +1,109 @@
+"""
+Compiled kernels evaluating membership functions over arrays.\n
+Scalar bodies of membership functions are shared by single pass loops over flat arrays and by parallel ufuncs,
+which are compiled on first use for large arrays.
+"""
+from math import exp
+
+from fuzzyLib.utils._jit import njit, vectorize
+
+
+def _gaussian(value, mean, max_value, inv_two_sigma_sq):
+    distance = mean - value
+    return max_value * exp(-(distance * distance) * inv_two_sigma_sq)
+
+
+def _triangular(value, l_end, center, r_end, left_slope, right_slope):
+    if value <= l_end or value >= r_end:
+        return 0.
+    if value <= center:
+        membership = (value - l_end) * left_slope
+    else:
+        membership = (r_end - value) * right_slope
+    return 1. if membership > 1. else membership
+
+
+def _trapezoidal(value, l_end, l_center, r_center, r_end, left_slope, right_slope, max_value):
+    if value <= l_end or value >= r_end:
+        return 0.
+    if value < l_center:
+        membership = (value - l_end) * left_slope
+    elif value <= r_center:
+        membership = max_value
+    else:
+        membership = (r_end - value) * right_slope
+    return 1. if membership > 1. else membership
+
+
+def _sigmoid(value, offset, magnitude, scaling):
+    z = magnitude * (value - offset)
+    # logistic function computed without overflow for large abs(z)
+    if z >= 0:
+        return scaling / (1. + exp(-z))
+    e = exp(z)
+    return scaling * e / (1. + e)
+
+
+_gaussian_value = njit(fastmath=True, cache=True)(_gaussian)
+_triangular_value = njit(fastmath=True, cache=True)(_triangular)
+_trapezoidal_value = njit(fastmath=True, cache=True)(_trapezoidal)
+
+
+@njit(fastmath=True, cache=True)
+def gaussian(values, mean, max_value, inv_two_sigma_sq, out):
+    """
+    Values of gaussian function at every point of flat values array.
+
+    :return: out
+    """
+    for i in range(values.shape[0]):
+        out[i] = _gaussian_value(values[i], mean, max_value, inv_two_sigma_sq)
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def triangular(values, l_end, center, r_end, left_slope, right_slope, out):
+    """
+    Values of triangular function at every point of flat values array, clipped to [0, 1].
+
+    :return: out
+    """
+    for i in range(values.shape[0]):
+        out[i] = _triangular_value(values[i], l_end, center, r_end, left_slope, right_slope)
+    return out
+
+
+@njit(fastmath=True, cache=True)
+def trapezoidal(values, l_end, l_center, r_center, r_end, left_slope, right_slope, max_value, out):
+    """
+    Values of trapezoidal function at every point of flat values array, clipped to [0, 1].
+
+    :return: out
+    """
+    for i in range(values.shape[0]):
+        out[i] = _trapezoidal_value(values[i], l_end, l_center, r_center, r_end, left_slope, right_slope, max_value)
+    return out
+
+
+_SCALAR_FUNCTIONS = {'gaussian': _gaussian, 'triangular': _triangular, 'trapezoidal': _trapezoidal,
+                     'sigmoid': _sigmoid}
+_parallel_ufuncs = {}
+
+
+def parallel_ufunc(name: str):
+    """
+    Returns ufunc of membership function, which evaluates arrays on all cores. Ufuncs have loops for single and
+    double precision, all arguments must be of the same type. Ufunc is compiled on the first call, so only
+    membership functions which are evaluated on large arrays pay for the compilation.
+    Must be used only if NUMBA_AVAILABLE.
+
+    :param name: name of membership function, one of gaussian, triangular, trapezoidal or sigmoid
+    :return: ufunc taking value and parameters of membership function
+    """
+    ufunc = _parallel_ufuncs.get(name)
+    if ufunc is None:
+        function = _SCALAR_FUNCTIONS[name]
+        arguments = function.__code__.co_argcount
+        signatures = [f'{dtype}({", ".join([dtype] * arguments)})' for dtype in ('float32', 'float64')]
+        ufunc = _parallel_ufuncs[name] = vectorize(signatures, target='parallel', fastmath=True)(function)
+    return ufunc
@@ -1,19 +1,103 @@
-from math import sin, exp
-from scipy.stats import norm
+from abc import ABC, abstractmethod
+from math import sin, exp, sqrt, log
+from scipy.special import expit
 
 import numpy as np
-import sympy as sy
 
-from sympy import symbols, Eq, solve
-from typing import Callable, List
-from functools import partial
+from typing import Callable, Tuple
+from functools import lru_cache
 
+from fuzzyLib.utils._jit import NUMBA_AVAILABLE
+from fuzzyLib.utils._numexpr import numexpr, NUMEXPR_AVAILABLE
+from fuzzyLib.utils.membership_functions import _kernels
 
-def __gaussian(value, mean, sigma, max_value):
-    return max_value * np.exp(-(((mean - value) ** 2) / (2 * sigma ** 2)))
 
+_SCALAR_TYPES = (float, int)
+"""
+Types of crisp values for which membership functions use math functions instead of numpy ufuncs.
+"""
 
-def gaussian(mean: float, sigma: float, max_value: float = 1) -> partial:
+
+def _logistic(z: float) -> float:
+    """
+    Logistic function of a scalar, 1 / (1 + exp(-z)), computed without overflow for large abs(z).
+    """
+    if z >= 0:
+        return 1. / (1. + exp(-z))
+    e = exp(z)
+    return e / (1. + e)
+
+
+def _float_dtype(value) -> np.dtype:
+    """
+    Type in which membership values of an array are computed. Single precision arrays stay in single precision,
+    as membership degrees lie in [0, 1], everything else is computed in double precision.
+    """
+    dtype = np.asarray(value).dtype
+    return dtype if dtype == np.float32 else np.dtype(np.float64)
+
+
+def _apply_kernel(kernel: Callable, value, *parameters) -> np.ndarray:
+    """
+    Evaluates compiled membership kernel at every point of an array of any shape.
+    Parameters are cast to the type of values, so single precision arrays are evaluated in single precision.
+
+    :param kernel: kernel taking flat values, parameters of membership function and flat output array
+    :param value: points at which membership function is evaluated
+    :param parameters: parameters of membership function passed to the kernel
+    :return: array of membership values of the shape of value
+    """
+    dtype = _float_dtype(value)
+    value = np.asarray(value, dtype=dtype)
+    out = np.empty(value.shape, dtype=dtype)
+    kernel(value.reshape(-1), *(dtype.type(parameter) for parameter in parameters), out.reshape(-1))
+    return out
+
+
+def _apply_parallel(name: str, value, *parameters) -> np.ndarray:
+    """
+    Evaluates membership function on all cores with its parallel ufunc.
+    Parameters are cast to the type of values, so single precision arrays are evaluated in single precision.
+
+    :param name: name of membership function in compiled kernels
+    :param value: points at which membership function is evaluated
+    :param parameters: parameters of membership function passed to the ufunc
+    :return: array of membership values of the shape of value
+    """
+    dtype = _float_dtype(value)
+    return _kernels.parallel_ufunc(name)(np.asarray(value, dtype=dtype),
+                                         *(dtype.type(parameter) for parameter in parameters))
+
+
+_PARALLEL_MIN_SIZE = 100000
+"""
+Number of elements from which array inputs are evaluated with parallel ufuncs when numba is available. On smaller
+arrays starting threads costs more than it saves.
+"""
+
+_NUMEXPR_MIN_SIZE = 1000
+"""
+Number of elements from which array inputs are evaluated with numexpr. On smaller arrays its call overhead outweighs
+saving temporary arrays of numpy.
+"""
+
+
+def __gaussian_array(value, mean, max_value, inv_two_sigma_sq):
+    if NUMBA_AVAILABLE:
+        if np.size(value) >= _PARALLEL_MIN_SIZE:
+            return _apply_parallel('gaussian', value, mean, max_value, inv_two_sigma_sq)
+        return _apply_kernel(_kernels.gaussian, value, mean, max_value, inv_two_sigma_sq)
+    distance = mean - value
+    if NUMEXPR_AVAILABLE and np.size(value) >= _NUMEXPR_MIN_SIZE:
+        # one fused pass over the array instead of a temporary array per operator
+        scalar = _float_dtype(value).type
+        return numexpr.evaluate('max_value * exp(-(distance * distance) * inv_two_sigma_sq)',
+                                local_dict={'distance': distance, 'max_value': scalar(max_value),
+                                            'inv_two_sigma_sq': scalar(inv_two_sigma_sq)})
+    return max_value * np.exp(-(distance * distance) * inv_two_sigma_sq)
+
+
+def gaussian(mean: float, sigma: float, max_value: float = 1) -> Callable[[float], float]:
     """
     Gaussian membership function.\n
     Defines membership function of gaussian distribution shape.\n
@@ -29,10 +113,42 @@ def gaussian(mean: float, sigma: float, max_value: float = 1) -> partial:
       >>> membership_value = gaussian_mf(0.5)
     """
 
-    # def output_mf(value: float) -> float:
-    #     return max_value * np.exp(-(((mean - value) ** 2) / (2 * sigma ** 2)))
+    # 1 / (2 * sigma^2) is computed once here, so every call multiplies instead of squaring and dividing.
+    # Parameters are bound as defaults, so scalar calls read them as locals and skip dispatch of functools.partial
+    def output_mf(value: float, _mean=mean, _max_value=max_value, _inv_two_sigma_sq=1. / (2. * sigma * sigma),
+                  _exp=exp) -> float:
+        if isinstance(value, _SCALAR_TYPES):
+            distance = _mean - value
+            return _max_value * _exp(-(distance * distance) * _inv_two_sigma_sq)
+        return __gaussian_array(value, _mean, _max_value, _inv_two_sigma_sq)
 
-    return partial(__gaussian, mean=mean, sigma=sigma, max_value=max_value)
+    output_mf.gaussian_parameters = (mean, sigma, max_value)
+    return output_mf
+
+
+def gaussian_parameters(membership_function: Callable) -> Tuple[float, float, float] or None:
+    """
+    Returns parameters of membership function created with gaussian, so callers can evaluate many gaussians
+    together in one vectorized expression.
+
+    :param membership_function: membership function
+    :return: (mean, sigma, max_value) or None if membership function was not created with gaussian
+    """
+    return getattr(membership_function, 'gaussian_parameters', None)
+
+
+def gaussians(parameters: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Evaluates many gaussian functions in one vectorized expression.
+
+    :param parameters: array of shape (number of gausses, 3), rows hold (mean, sigma, max_value)
+    :param x: points at which gausses are evaluated
+    :return: array in which i-th row holds values of i-th gaussian at x
+    """
+    parameters = np.asarray(parameters, dtype=np.float64)
+    means, sigmas, max_values = (parameters[:, i, None] for i in range(3))
+    distances = np.asarray(x)[None, :] - means
+    return max_values * np.exp(-(distances * distances) * (1. / (2. * sigmas * sigmas)))
 
 
 def complex_gaussian(mean: float, first_sigma: float, second_sigma, min=-np.inf, max=np.inf,
@@ -52,14 +168,32 @@ def complex_gaussian(mean: float, first_sigma: float, second_sigma, min=-np.inf,
       >>> membership_value = gaussian_mf(0.5)
     """
 
+    first_inv_two_sigma_sq = 1. / (2. * first_sigma * first_sigma)
+    second_inv_two_sigma_sq = 1. / (2. * second_sigma * second_sigma)
+
     def output_mf(value: float) -> float:
+        if not isinstance(value, _SCALAR_TYPES):
+            return output_mf_array(np.asarray(value, dtype=_float_dtype(value)))
         if min <= value <= max:
+            distance = mean - value
             if value < mean:
-                return max_value * np.exp(-(((mean - value) ** 2) / (2 * first_sigma ** 2)))
+                return max_value * exp(-(distance * distance) * first_inv_two_sigma_sq)
             else:
-                return max_value * np.exp(-(((mean - value) ** 2) / (2 * second_sigma ** 2)))
+                return max_value * exp(-(distance * distance) * second_inv_two_sigma_sq)
         else:
             return 0.0
+
+    def output_mf_array(value: np.ndarray) -> np.ndarray:
+        scalar = value.dtype.type
+        inv_two_sigma_sq = np.where(value < mean, scalar(first_inv_two_sigma_sq), scalar(second_inv_two_sigma_sq))
+        inside = (value >= min) & (value <= max)
+        distance = mean - value
+        if NUMEXPR_AVAILABLE and value.size >= _NUMEXPR_MIN_SIZE:
+            return numexpr.evaluate('where(inside, max_value * exp(-(distance * distance) * inv_two_sigma_sq), 0.)',
+                                    local_dict={'inside': inside, 'distance': distance, 'max_value': max_value,
+                                                'inv_two_sigma_sq': inv_two_sigma_sq})
+        return np.where(inside, max_value * np.exp(-(distance * distance) * inv_two_sigma_sq), 0.)
+
     return output_mf
 
 
@@ -80,7 +214,11 @@ def sigmoid(offset: float, magnitude: float, scaling: float = 1.) -> Callable[[f
     """
 
     def output_mf(value: float) -> float:
-        return 1. / (1. + np.exp(- magnitude * (value - offset))) * scaling
+        if isinstance(value, _SCALAR_TYPES):
+            return _logistic(magnitude * (value - offset)) * scaling
+        if NUMBA_AVAILABLE and np.size(value) >= _PARALLEL_MIN_SIZE:
+            return _apply_parallel('sigmoid', value, offset, magnitude, scaling)
+        return expit(magnitude * (value - offset)) * scaling
 
     return output_mf
 
@@ -102,7 +240,11 @@ def sigmoid_reversed(offset: float, magnitude: float, scaling: float = 1.) -> Ca
     """
 
     def output_mf(value: float) -> float:
-        return 1 - (1. / (1. + np.exp(- magnitude * (value - offset))) * scaling)
+        if isinstance(value, _SCALAR_TYPES):
+            return 1 - _logistic(magnitude * (value - offset)) * scaling
+        if NUMBA_AVAILABLE and np.size(value) >= _PARALLEL_MIN_SIZE:
+            return 1 - _apply_parallel('sigmoid', value, offset, magnitude, scaling)
+        return 1 - expit(magnitude * (value - offset)) * scaling
 
     return output_mf
 
@@ -124,11 +266,23 @@ def triangular(l_end: float, center: float, r_end: float, max_value: float = 1)
       >>> membership_value - triangle_mf(0.6)
     """
 
+    # slopes of both sides are computed once, every call only multiplies
+    left_slope = max_value / (center - l_end)
+    right_slope = max_value / (r_end - center)
+
     def output_mf(value: float) -> float:
+        if isinstance(value, _SCALAR_TYPES):
+            if value <= l_end or value >= r_end:
+                return 0.
+            membership = (value - l_end) * left_slope if value <= center else (r_end - value) * right_slope
+            return 1. if membership > 1. else membership
+        if NUMBA_AVAILABLE:
+            if np.size(value) >= _PARALLEL_MIN_SIZE:
+                return _apply_parallel('triangular', value, l_end, center, r_end, left_slope, right_slope)
+            return _apply_kernel(_kernels.triangular, value, l_end, center, r_end, left_slope, right_slope)
         return np.minimum(1,
-                          np.maximum(0, ((max_value * (value - l_end) / (center - l_end)) * (value <= center) +
-                                         ((max_value * ((r_end - value) / (r_end - center))) * (
-                                                 value > center)))))
+                          np.maximum(0, (((value - l_end) * left_slope) * (value <= center) +
+                                         (((r_end - value) * right_slope) * (value > center)))))
 
     return output_mf
 
@@ -152,11 +306,30 @@ def trapezoidal(l_end: float, l_center: float, r_center: float, r_end: float, ma
       >>> membership_value = trapezoid_mf(0.4)
     """
 
+    left_slope = max_value / (l_center - l_end)
+    right_slope = max_value / (r_end - r_center)
+
     def output_mf(value: float) -> float:
+        if isinstance(value, _SCALAR_TYPES):
+            if value <= l_end or value >= r_end:
+                return 0.
+            if value < l_center:
+                membership = (value - l_end) * left_slope
+            elif value <= r_center:
+                membership = max_value
+            else:
+                membership = (r_end - value) * right_slope
+            return 1. if membership > 1. else membership
+        if NUMBA_AVAILABLE:
+            if np.size(value) >= _PARALLEL_MIN_SIZE:
+                return _apply_parallel('trapezoidal', value, l_end, l_center, r_center, r_end, left_slope,
+                                       right_slope, max_value)
+            return _apply_kernel(_kernels.trapezoidal, value, l_end, l_center, r_center, r_end, left_slope,
+                                 right_slope, max_value)
         return np.minimum(1, np.maximum(0, (
-                (((max_value * ((value - l_end) / (l_center - l_end))) * (value <= l_center)) +
-                 ((max_value * ((r_end - value) / (r_end - r_center))) * (value >= r_center))) +
-                (max_value * ((value > l_center) * (value < r_center))))))
+                ((((value - l_end) * left_slope) * (value <= l_center)) +
+                 (((r_end - value) * right_slope) * (value >= r_center))) +
+                (_float_dtype(value).type(max_value) * ((value > l_center) * (value < r_center))))))
 
     return output_mf
 
@@ -178,12 +351,306 @@ def linear(a: float, b: float, max_value: float = 1) -> Callable[[float], float]
     """
 
     def output_mf(value: float) -> float:
-        return float(np.minimum((value * a) + b, max_value) if ((value * a) + b) > 0 else 0)
+        membership = value * a + b
+        return 0. if membership <= 0. else (max_value if membership > max_value else membership)
 
     return output_mf
 
 
-def generate_equal_gausses(number_of_gausses: int, start: float, end: float, max_value: float = 1., mid_ev: float = None) -> List[Callable]:
+class _MembershipFunctionBank(ABC):
+    """
+    Base of banks of membership functions stored as arrays of their parameters. Bank can be evaluated as a whole
+    or used as a sequence of single membership functions, which are created on first access.
+    """
+
+    def __init__(self, size: int):
+        self.__functions = [None] * size
+
+    @abstractmethod
+    def _create(self, index: int) -> Callable[[float], float]:
+        pass
+
+    def __len__(self) -> int:
+        return len(self.__functions)
+
+    def __getitem__(self, index: int) -> Callable[[float], float]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        function = self.__functions[index]
+        if function is None:
+            function = self.__functions[index] = self._create(range(len(self))[index])
+        return function
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class GaussianBank(_MembershipFunctionBank):
+    """
+    Bank of gaussian membership functions stored as arrays of their parameters.
+
+    Attributes
+    --------------------------------------------
+    __means : np.ndarray
+        expected values of gausses
+    __sigmas : np.ndarray
+        standard deviations of gausses
+    __max_value : float
+        maximum value of all gausses, height
+
+    Methods
+    --------------------------------------------
+    __call__(x) -> np.ndarray
+        values of all gausses at x, last axis goes over gausses
+
+    Example:
+      >>> bank = GaussianBank([0., 0.5, 1.], [0.2, 0.2, 0.2])
+      >>> memberships = bank(0.3)
+      >>> low = bank[0]
+    """
+
+    def __init__(self, means: np.ndarray, sigmas: np.ndarray, max_value: float = 1.):
+        """
+        :param means: expected values of gausses
+        :param sigmas: standard deviations of gausses, one for every gauss or a common one
+        :param max_value: maximum value of all gausses, height
+        """
+        self.__means = np.asarray(means, dtype=np.float64)
+        self.__sigmas = np.broadcast_to(np.asarray(sigmas, dtype=np.float64), self.__means.shape)
+        self.__max_value = max_value
+        self.__inv_two_sigma_sq = 1. / (2. * self.__sigmas * self.__sigmas)
+        super().__init__(len(self.__means))
+
+    @property
+    def means(self) -> np.ndarray:
+        """
+        Getter of expected values of gausses
+        :return: means
+        """
+        return self.__means
+
+    @property
+    def sigmas(self) -> np.ndarray:
+        """
+        Getter of standard deviations of gausses
+        :return: sigmas
+        """
+        return self.__sigmas
+
+    @property
+    def max_value(self) -> float:
+        """
+        Getter of maximum value of membership functions
+        :return: max_value
+        """
+        return self.__max_value
+
+    @property
+    def parameters(self) -> np.ndarray:
+        """
+        Parameters of gausses as array of shape (number of gausses, 3) with rows (mean, sigma, max_value),
+        which can be evaluated with gaussians.
+        """
+        return np.column_stack((self.__means, self.__sigmas, np.full(len(self), self.__max_value)))
+
+    def __call__(self, x: float or np.ndarray) -> np.ndarray:
+        # single precision samples are evaluated in single precision, like single membership functions
+        dtype = _float_dtype(x)
+        distances = np.asarray(x, dtype=dtype)[..., None] - self.__means.astype(dtype, copy=False)
+        return dtype.type(self.__max_value) * np.exp(-(distances * distances)
+                                                     * self.__inv_two_sigma_sq.astype(dtype, copy=False))
+
+    def _create(self, index: int) -> Callable[[float], float]:
+        return gaussian(float(self.__means[index]), float(self.__sigmas[index]), self.__max_value)
+
+
+class TriangularBank(_MembershipFunctionBank):
+    """
+    Bank of triangular membership functions stored as arrays of their parameters.
+
+    Attributes
+    --------------------------------------------
+    __l_ends : np.ndarray
+        left ends of triangles
+    __centers : np.ndarray
+        top vertices of triangles
+    __r_ends : np.ndarray
+        right ends of triangles
+    __max_value : float
+        maximum value of all triangles, height
+
+    Methods
+    --------------------------------------------
+    __call__(x) -> np.ndarray
+        values of all triangles at x, last axis goes over triangles
+
+    Example:
+      >>> bank = TriangularBank([0., 0.25, 0.5], [0.25, 0.5, 0.75], [0.5, 0.75, 1.])
+      >>> memberships = bank(0.3)
+    """
+
+    def __init__(self, l_ends: np.ndarray, centers: np.ndarray, r_ends: np.ndarray, max_value: float = 1.):
+        """
+        :param l_ends: left ends of triangles
+        :param centers: top vertices of triangles
+        :param r_ends: right ends of triangles
+        :param max_value: maximum value of all triangles, height
+        """
+        self.__l_ends = np.asarray(l_ends, dtype=np.float64)
+        self.__centers = np.asarray(centers, dtype=np.float64)
+        self.__r_ends = np.asarray(r_ends, dtype=np.float64)
+        self.__max_value = max_value
+        self.__left_slopes = max_value / (self.__centers - self.__l_ends)
+        self.__right_slopes = max_value / (self.__r_ends - self.__centers)
+        super().__init__(len(self.__centers))
+
+    @property
+    def l_ends(self) -> np.ndarray:
+        """
+        Getter of left ends of triangles
+        :return: l_ends
+        """
+        return self.__l_ends
+
+    @property
+    def centers(self) -> np.ndarray:
+        """
+        Getter of top vertices of triangles
+        :return: centers
+        """
+        return self.__centers
+
+    @property
+    def r_ends(self) -> np.ndarray:
+        """
+        Getter of right ends of triangles
+        :return: r_ends
+        """
+        return self.__r_ends
+
+    @property
+    def max_value(self) -> float:
+        """
+        Getter of maximum value of membership functions
+        :return: max_value
+        """
+        return self.__max_value
+
+    def __call__(self, x: float or np.ndarray) -> np.ndarray:
+        x = np.asarray(x)[..., None]
+        memberships = np.where(x <= self.__centers, (x - self.__l_ends) * self.__left_slopes,
+                               (self.__r_ends - x) * self.__right_slopes)
+        return np.clip(memberships, 0., 1., out=memberships)
+
+    def _create(self, index: int) -> Callable[[float], float]:
+        return triangular(float(self.__l_ends[index]), float(self.__centers[index]), float(self.__r_ends[index]),
+                          self.__max_value)
+
+
+class TrapezoidalBank(_MembershipFunctionBank):
+    """
+    Bank of trapezoidal membership functions stored as arrays of their parameters. Trapezoid with equal
+    top vertices is a triangle, so banks mixing trapezoids and triangles are stored in the same arrays.
+
+    Attributes
+    --------------------------------------------
+    __l_ends : np.ndarray
+        left ends of trapezoids
+    __l_centers : np.ndarray
+        top left vertices of trapezoids
+    __r_centers : np.ndarray
+        top right vertices of trapezoids
+    __r_ends : np.ndarray
+        right ends of trapezoids
+    __max_value : float
+        maximum value of all trapezoids, height
+
+    Methods
+    --------------------------------------------
+    __call__(x) -> np.ndarray
+        values of all trapezoids at x, last axis goes over trapezoids
+
+    Example:
+      >>> bank = TrapezoidalBank([0., 0.4], [0.2, 0.6], [0.4, 0.6], [0.6, 0.8])
+      >>> memberships = bank(0.3)
+    """
+
+    def __init__(self, l_ends: np.ndarray, l_centers: np.ndarray, r_centers: np.ndarray, r_ends: np.ndarray,
+                 max_value: float = 1.):
+        """
+        :param l_ends: left ends of trapezoids
+        :param l_centers: top left vertices of trapezoids
+        :param r_centers: top right vertices of trapezoids, equal to top left ones for triangles
+        :param r_ends: right ends of trapezoids
+        :param max_value: maximum value of all trapezoids, height
+        """
+        self.__l_ends = np.asarray(l_ends, dtype=np.float64)
+        self.__l_centers = np.asarray(l_centers, dtype=np.float64)
+        self.__r_centers = np.asarray(r_centers, dtype=np.float64)
+        self.__r_ends = np.asarray(r_ends, dtype=np.float64)
+        self.__max_value = max_value
+        self.__left_slopes = max_value / (self.__l_centers - self.__l_ends)
+        self.__right_slopes = max_value / (self.__r_ends - self.__r_centers)
+        super().__init__(len(self.__l_centers))
+
+    @property
+    def l_ends(self) -> np.ndarray:
+        """
+        Getter of left ends of trapezoids
+        :return: l_ends
+        """
+        return self.__l_ends
+
+    @property
+    def l_centers(self) -> np.ndarray:
+        """
+        Getter of top left vertices of trapezoids
+        :return: l_centers
+        """
+        return self.__l_centers
+
+    @property
+    def r_centers(self) -> np.ndarray:
+        """
+        Getter of top right vertices of trapezoids
+        :return: r_centers
+        """
+        return self.__r_centers
+
+    @property
+    def r_ends(self) -> np.ndarray:
+        """
+        Getter of right ends of trapezoids
+        :return: r_ends
+        """
+        return self.__r_ends
+
+    @property
+    def max_value(self) -> float:
+        """
+        Getter of maximum value of membership functions
+        :return: max_value
+        """
+        return self.__max_value
+
+    def __call__(self, x: float or np.ndarray) -> np.ndarray:
+        x = np.asarray(x)[..., None]
+        # sides are negative outside of the support, so clipping zeroes them there
+        memberships = np.where(x < self.__l_centers, (x - self.__l_ends) * self.__left_slopes,
+                               np.where(x <= self.__r_centers, self.__max_value,
+                                        (self.__r_ends - x) * self.__right_slopes))
+        return np.clip(memberships, 0., 1., out=memberships)
+
+    def _create(self, index: int) -> Callable[[float], float]:
+        l_end, l_center = float(self.__l_ends[index]), float(self.__l_centers[index])
+        r_center, r_end = float(self.__r_centers[index]), float(self.__r_ends[index])
+        if l_center == r_center:
+            return triangular(l_end, l_center, r_end, self.__max_value)
+        return trapezoidal(l_end, l_center, r_center, r_end, self.__max_value)
+
+
+def generate_equal_gausses(number_of_gausses: int, start: float, end: float, max_value: float = 1., mid_ev: float = None,
+                           return_params: bool = False) -> GaussianBank or np.ndarray:
     """
     Generates specified number of gaussian functions with equal
     standard deviation distributed evenly across given domain.
@@ -192,9 +659,10 @@ def generate_equal_gausses(number_of_gausses: int, start: float, end: float, max
     :param start: start of domain
     :param end: end of domain
     :param max_value: maximum value of gaussian functions, height
-    :return: list of callable gaussian functions
+    :param return_params: return parameters of gausses instead of functions
+    :return: bank of gaussian functions or, if return_params is True, array of shape (number_of_gausses, 3)
+        with rows (mean, sigma, max_value), which can be evaluated with gaussians
     """
-    result = np.zeros(number_of_gausses, dtype=type(gaussian))
     if mid_ev is not None:
         domain = mid_ev * 2
     else:
@@ -206,15 +674,42 @@ def generate_equal_gausses(number_of_gausses: int, start: float, end: float, max
 
     std_deviation = __calculate_sigma(expected_value_of_first_gaussian, expected_value_of_second_gaussian, max_value)
 
-    expected_value = 0.
-    result[0] = gaussian(expected_value, std_deviation, max_value)
-    for i in range(1, number_of_gausses):
-        expected_value = (domain / cross_points) * i
-        result[i] = gaussian(expected_value, std_deviation, max_value)
+    parameters = np.empty((number_of_gausses, 3), dtype=np.float64)
+    parameters[:, 0] = (domain / cross_points) * np.arange(number_of_gausses)
+    parameters[:, 1] = std_deviation
+    parameters[:, 2] = max_value
+    if return_params:
+        return parameters
+
+    return GaussianBank(parameters[:, 0], std_deviation, max_value)
+
+
+_FWHM_FACTOR = 2. * sqrt(2. * log(2.))
+"""
+Full width at half maximum of gaussian function in units of its standard deviation. Gausses of height 1 cross
+at 1 / 2 when distance between their means is sigma times this factor.
+"""
+
+
+@lru_cache(maxsize=64)
+def __cross_factor(max_value: float = 1.) -> float:
+    """
+    Calculates ratio of distance between means of gausses of the same sigma and height to that sigma, for which
+    the gausses cross at max_value / 2.
+    Gausses cross in the middle between their means, so the cross point condition
+    exp(-(d / 2) ** 2 / (2 * sigma ** 2)) = max_value / 2, where d is the distance between means, gives d / sigma.
 
-    return result
+    :param max_value: maximum value of gaussian functions, height
+    :return: distance between means divided by sigma
+    """
+    if max_value == 1:
+        return _FWHM_FACTOR
+    if not 0 < max_value < 2:
+        raise ValueError('Gausses cross at max_value / 2 only for max_value in range (0, 2)')
+    return 2. * sqrt(2. * log(2. / max_value))
 
 
+@lru_cache(maxsize=4096)
 def __calculate_sigma(first_mean: float, second_mean: float, max_value: float = 1.) -> float:
     """
     Calculates standard deviation using cross point between gaussian functions with given expected values.
@@ -224,22 +719,10 @@ def __calculate_sigma(first_mean: float, second_mean: float, max_value: float =
     :param max_value: maximum value of gaussian functions, height
     :return: standard deviation for the gausses to cross at max_value / 2
     """
-    shift = max_value / 2
-    x, sigma = symbols('x sigma')
-    # The equations read like this:
-    # calculate x and sigma based on cross point between gaussian functions with given expected values
-    eq1 = Eq(sy.exp(-((x - first_mean) ** 2.) / (2 * sigma ** 2.)) - shift, 0)
-    eq2 = Eq(sy.exp(-((x - second_mean) ** 2.) / (2 * sigma ** 2.)) - shift, 0)
-
-    solutions = solve((eq1, eq2), (x, sigma), dict=True)
-    sigma_value = [solution[sigma] for solution in solutions if solution[sigma] >= 0][0]
-
-    return np.float64(sigma_value)
+    return abs(second_mean - first_mean) / __cross_factor(max_value)
 
 
 def generate_progressive_gausses(number_of_gausses: int, middle=0.5, max_value: float = 1):
-    expected_values = [0, middle, 1]
-    first_sigmas = []
     gausses = []
     if number_of_gausses < 3:
         raise Exception('Number of gausses must be >= 3 for progressive distribution')
@@ -247,26 +730,20 @@ def generate_progressive_gausses(number_of_gausses: int, middle=0.5, max_value:
     number_of_gausses -= 3
     left_to_calc = int(number_of_gausses / 2)
 
+    expected_values = [0, middle, 1] + [0.] * (2 * left_to_calc)
     for i in range(left_to_calc):
         arg = exp(-(left_to_calc - i))
-        right_ex = __calculate_expected_value(arg, middle)
-        left_ex = __calculate_expected_value(-arg, middle)
-        expected_values.append(left_ex)
-        expected_values.append(right_ex)
-    expected_values = sorted(expected_values)
-
-    for i in range(len(expected_values) - 1):
-        first_mean = expected_values[i]
-        second_mean = expected_values[i + 1]
-        first_sigmas.append(__calculate_sigma(first_mean, second_mean, max_value))
-    first_sigmas.append(first_sigmas[-1])
-    second_sigmas = first_sigmas[:-1]
-    second_sigmas.insert(0, first_sigmas[-1])
+        expected_values[3 + 2 * i] = __calculate_expected_value(-arg, middle)
+        expected_values[4 + 2 * i] = __calculate_expected_value(arg, middle)
+    expected_values.sort()
+
+    # sigma is proportional to the distance between means, so sigmas of all neighbouring pairs are computed at once
+    sigmas = (np.abs(np.diff(expected_values)) / __cross_factor(max_value)).tolist()
+    first_sigmas = sigmas + [sigmas[-1]]
+    second_sigmas = [sigmas[-1]] + sigmas
 
     i = 1
-    ex_values_extended = expected_values.copy()
-    ex_values_extended.insert(0, -np.inf)
-    ex_values_extended.append(np.inf)
+    ex_values_extended = [-np.inf] + expected_values + [np.inf]
     for ex, first_sigma, second_sigma in zip(expected_values, second_sigmas, first_sigmas):
         min_ex = ex_values_extended[i - 1]
         max_ex = ex_values_extended[i + 1]
@@ -276,50 +753,40 @@ def generate_progressive_gausses(number_of_gausses: int, middle=0.5, max_value:
     return gausses
 
 
+@lru_cache(maxsize=4096)
 def __calculate_expected_value(x, middle):
     return 0.5 * sin(x) + middle
 
 
-def generate_even_triangulars(n_mfs: int, start: float, end: float, max_value: float = 1):
+def generate_even_triangulars(n_mfs: int, start: float, end: float, max_value: float = 1) -> TriangularBank:
     step = (end - start) / (n_mfs + 1)
-    fuzzy_sets = []
-    for _ in range(n_mfs):
-        fuzzy_sets.append(triangular(start, start + step, start + 2 * step, max_value))
-        start += step
-    return fuzzy_sets
+    l_ends = start + step * np.arange(n_mfs)
+    return TriangularBank(l_ends, l_ends + step, l_ends + 2 * step, max_value)
 
 
-def generate_full_triangulars(n_mfs: int, start: float, end: float, max_value: float = 1):
+def generate_full_triangulars(n_mfs: int, start: float, end: float, max_value: float = 1) -> TriangularBank:
     step = (end - start) / (n_mfs - 1)
-    fuzzy_sets = []
+    centers = start + step * np.arange(n_mfs)
+    centers[-1] = end
+    l_ends, r_ends = centers - step, centers + step
+    # outer triangles reach just past the domain, so its ends fully belong to them
+    l_ends[0], r_ends[-1] = start - 0.001, end + 0.001
+    return TriangularBank(l_ends, centers, r_ends, max_value)
 
-    fuzzy_sets.append(triangular(start - 0.001, start, start + step, max_value))
-    for _ in range(n_mfs - 2):
-        fuzzy_sets.append(triangular(start, start + step, start + 2 * step, max_value))
-        start += step
-    fuzzy_sets.append(triangular(end - step, end, end + 0.001, max_value))
 
-    return fuzzy_sets
-
-
-def generate_even_trapezoidals(n_mfs: int, start: float, end: float, max_value: float = 1):
+def generate_even_trapezoidals(n_mfs: int, start: float, end: float, max_value: float = 1) -> TrapezoidalBank:
     step = (end - start) / (2 * n_mfs + 1)
-    fuzzy_sets = []
-    for _ in range(n_mfs):
-        fuzzy_sets.append(trapezoidal(start, start + step, start + 2 * step, start + 3 * step, max_value))
-        start += 2 * step
-    return fuzzy_sets
+    l_ends = start + 2 * step * np.arange(n_mfs)
+    return TrapezoidalBank(l_ends, l_ends + step, l_ends + 2 * step, l_ends + 3 * step, max_value)
 
 
-def generate_full_trapezoidals(n_mfs: int, start: float, end: float, max_value: float = 1):
+def generate_full_trapezoidals(n_mfs: int, start: float, end: float, max_value: float = 1) -> TrapezoidalBank:
     step = (end - start) / (2 * n_mfs - 1)
-    fuzzy_sets = []
-
-    fuzzy_sets.append(trapezoidal(start - 0.001, start, start + step, start + 2 * step, max_value))
-    start += step
-    for _ in range(n_mfs - 2):
-        fuzzy_sets.append(triangular(start, start + step, start + 2 * step, max_value))
-        start += step
-    fuzzy_sets.append(trapezoidal(end - 2 * step, end - step, end, end + 0.001, max_value))
-
-    return fuzzy_sets
+    # outer sets are trapezoids reaching just past the domain, inner ones are triangles with equal top vertices
+    l_centers = start + step * np.arange(1, n_mfs + 1)
+    l_centers[0], l_centers[-1] = start, end - step
+    r_centers = l_centers.copy()
+    r_centers[0], r_centers[-1] = start + step, end
+    l_ends, r_ends = l_centers - step, r_centers + step
+    l_ends[0], r_ends[-1] = start - 0.001, end + 0.001
+    return TrapezoidalBank(l_ends, l_centers, r_centers, r_ends, max_value)
@@ -149,6 +149,16 @@ class TestGodelAlgebra:
             c
         ))
 
+    @pytest.mark.parametrize('step', [1, 2])
+    def test_implication_out_aliasing_b(self, step):
+        a = np.array([0.2, 0.7, 0.9])
+        storage = np.zeros(3 * step)
+        b = storage[::step]
+        b[:] = [0.1, 0.3, 0.95]
+        result = GodelAlgebra.implication(a, b, out=b)
+        assert all(res == approx(exp) for res, exp in zip(result, [0.8, 0.3, 0.95]))
+        assert all(res == approx(exp) for res, exp in zip(b, [0.8, 0.3, 0.95]))
+
     @pytest.mark.parametrize('a, b, c', zip(
         [(1.0, 0.0), [0.2, 0.95]],
         [(0.0, 1.0), np.array([0.35, 0.2])],
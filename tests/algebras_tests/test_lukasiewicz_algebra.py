@@ -0,0 +1,142 @@
+import pytest
+import numpy as np
+
+from tests.test_tools import approx, _random_sample
+from fuzzyLib.algebras.lukasiewicz_algebra import LukasiewiczAlgebra
+
+
+class TestLukasiewiczAlgebra:
+
+    @pytest.mark.parametrize('a, b, result', list(zip(
+        [0.9, 1.0, 1.0, 0.2],
+        [0.2, 1.0, 0.0, 0.35],
+        [0.1, 1.0, 0.0, 0.0]
+    )))
+    def test_t_norm(self, a, b, result):
+        assert LukasiewiczAlgebra.t_norm(a, b) == approx(result)
+
+    @pytest.mark.parametrize('a, b, result', list(zip(
+        [np.array([0.9, 1.0, 1.0, 0.2])],
+        [np.array([0.2, 1.0, 0.0, 0.35])],
+        [[0.1, 1.0, 0.0, 0.0]]
+    )))
+    def test_t_norm_array(self, a, b, result):
+        assert all(res == approx(exp) for res, exp in zip(
+            LukasiewiczAlgebra.t_norm(a, b),
+            result
+        ))
+
+    @pytest.mark.parametrize('a, b, result', list(zip(
+        [(0.9, 1.0)],
+        [[0.2, 1.0]],
+        [[0.1, 1.0]]
+    )))
+    def test_t_norm_iterable(self, a, b, result):
+        assert all(res == approx(exp) for res, exp in zip(
+            LukasiewiczAlgebra.t_norm(a, b), result
+        ))
+
+    @pytest.mark.parametrize('a, b', list(zip(
+        [np.random.randn(2),
+         np.random.randn(3),
+         np.random.randn(2, 3),
+         np.random.randn(5, 3),
+         ],
+        [np.random.randn(1),
+         3,
+         np.random.randn(3, 2),
+         np.random.randn(5, 2),
+         ],
+    )))
+    def test_t_norm_incompatible_dimensions(self, a, b):
+        with pytest.raises(ValueError):
+            _ = LukasiewiczAlgebra.t_norm(a, b)
+
+    @pytest.mark.parametrize('a, b, c', list(zip(
+        [0.9, 1.0, 1.0, 0.2],
+        [0.2, 1.0, 0.0, 0.35],
+        [1.0, 1.0, 1.0, 0.55]
+    )))
+    def test_s_norm(self, a, b, c):
+        assert LukasiewiczAlgebra.s_norm(a, b) == approx(c)
+
+    @pytest.mark.parametrize('a, b, c', list(zip(
+        [np.array([0.9, 1.0, 1.0, 0.2])],
+        [np.array([0.2, 1.0, 0.0, 0.35])],
+        [[1.0, 1.0, 1.0, 0.55]]
+    )))
+    def test_s_norm_array(self, a, b, c):
+        assert all(res == approx(exp) for res, exp in zip(
+            LukasiewiczAlgebra.s_norm(a, b),
+            c
+        ))
+
+    @pytest.mark.parametrize('a, b', list(zip(
+        [np.array([1.0, 0.0, 0.2])],
+        [[0.0, 1.0, 0.8]]
+    )))
+    def test_negation_array(self, a, b):
+        assert all(res == approx(exp) for res, exp in zip(
+            LukasiewiczAlgebra.negation(a),
+            b
+        ))
+
+    @pytest.mark.parametrize('a, b, c', list(zip(
+        [1.0, 0.0, 0.2, 0.95],
+        [0.0, 1.0, 0.35, 0.2],
+        [0.0, 1.0, 1.0, 0.25]
+    )))
+    def test_implication(self, a, b, c):
+        assert LukasiewiczAlgebra.implication(a, b) == approx(c)
+
+    @pytest.mark.parametrize('a, b, c', list(zip(
+        [np.array([1.0, 0.0, 0.2, 0.95])],
+        [np.array([0.0, 1.0, 0.35, 0.2])],
+        [[0.0, 1.0, 1.0, 0.25]]
+    )))
+    def test_implication_array(self, a, b, c):
+        assert all(res == approx(exp) for res, exp in zip(
+            LukasiewiczAlgebra.implication(a, b),
+            c
+        ))
+
+    @pytest.mark.parametrize('step', [1, 2])
+    def test_implication_out_aliasing_b(self, step):
+        a = np.array([0.2, 0.7, 0.9])
+        storage = np.zeros(3 * step)
+        b = storage[::step]
+        b[:] = [0.1, 0.3, 0.95]
+        result = LukasiewiczAlgebra.implication(a, b, out=b)
+        assert all(res == approx(exp) for res, exp in zip(result, [0.9, 0.6, 1.0]))
+        assert all(res == approx(exp) for res, exp in zip(b, [0.9, 0.6, 1.0]))
+
+    def test_operations_match_definitions_on_domain(self):
+        a = _random_sample(0, 1, 10001)
+        b = _random_sample(0, 1, 10001)
+        assert LukasiewiczAlgebra.t_norm(a, b) == approx(np.maximum(0., a + b - 1.))
+        assert LukasiewiczAlgebra.s_norm(a, b) == approx(np.minimum(1., a + b))
+        assert LukasiewiczAlgebra.implication(a, b) == approx(np.minimum(1., 1. - a + b))
+        assert LukasiewiczAlgebra.negation(a) == approx(1. - a)
+
+    def test_operations_on_interval_type2_degrees(self):
+        a = _random_sample(0, 1, (2, 100))
+        b = _random_sample(0, 1, (2, 100))
+        assert LukasiewiczAlgebra.t_norm(a, b) == approx(np.maximum(0., a + b - 1.))
+
+    def test_operations_write_to_out(self):
+        a = _random_sample(0, 1, 100)
+        b = _random_sample(0, 1, 100)
+        out = np.empty(100)
+        result = LukasiewiczAlgebra.t_norm(a, b, out=out)
+        assert result is out
+        assert out == approx(np.maximum(0., a + b - 1.))
+        result = LukasiewiczAlgebra.negation(a[::2], out=out[:50])
+        assert result == approx(1. - a[::2])
+        assert out[:50] == approx(1. - a[::2])
+
+    def test_operations_keep_single_precision(self):
+        a = _random_sample(0, 1, 100).astype(np.float32)
+        b = _random_sample(0, 1, 100).astype(np.float32)
+        result = LukasiewiczAlgebra.s_norm(a, b)
+        assert result.dtype == np.float32
+        assert result == pytest.approx(np.minimum(1., a + b), abs=1e-6)
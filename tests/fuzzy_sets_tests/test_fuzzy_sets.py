@@ -0,0 +1,38 @@
+import pytest
+import numpy as np
+
+from tests.test_tools import approx
+from fuzzyLib.fuzzySetsFol.type1_fuzzy_set import Type1FuzzySet
+from fuzzyLib.fuzzySetsFol.interval_type2_fuzzy_set import IntervalType2FuzzySet
+from fuzzyLib.utils.membership_functions.membership_functions import gaussian, triangular
+
+
+class TestType1FuzzySet:
+
+    @pytest.mark.parametrize('mf', [gaussian(0.4, 0.1), triangular(0.1, 0.4, 0.7)])
+    def test_scalar_gives_float(self, mf):
+        fuzzy_set = Type1FuzzySet(mf)
+        assert isinstance(fuzzy_set(0.3), float)
+        assert fuzzy_set(0.3) == approx(mf(0.3))
+
+    @pytest.mark.parametrize('x', [[0.1, 0.3, 0.5], (0.1, 0.3, 0.5), np.array([0.1, 0.3, 0.5])])
+    def test_sequence_gives_array(self, x):
+        mf = gaussian(0.4, 0.1)
+        result = Type1FuzzySet(mf)(x)
+        assert isinstance(result, np.ndarray)
+        assert all(res == approx(mf(float(v))) for res, v in zip(result, x))
+
+    def test_scalar_only_membership_function(self):
+        fuzzy_set = Type1FuzzySet(lambda v: 0.5 if v > 0.3 else 0.1)
+        assert fuzzy_set(0.4) == approx(0.5)
+        assert all(res == approx(exp) for res, exp in zip(fuzzy_set([0.1, 0.5]), [0.1, 0.5]))
+
+
+class TestIntervalType2FuzzySet:
+
+    def test_scalar_and_sequence(self):
+        lower, upper = triangular(0.1, 0.4, 0.7, 0.8), triangular(0.1, 0.4, 0.7)
+        fuzzy_set = IntervalType2FuzzySet(lower, upper)
+        assert fuzzy_set(0.3).shape == (2,)
+        assert all(res == approx(exp) for res, exp in zip(fuzzy_set(0.3), [lower(0.3), upper(0.3)]))
+        assert fuzzy_set([0.3, 0.5]).shape == (2, 2)
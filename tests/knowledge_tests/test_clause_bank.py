@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+
+from tests.test_tools import approx
+from fuzzyLib.knowledge.linguistic_variable import Domain, LinguisticVariable
+from fuzzyLib.knowledge.clause import Clause
+from fuzzyLib.knowledge.clause_bank import ClauseBank
+from fuzzyLib.fuzzySetsFol.type1_fuzzy_set import Type1FuzzySet
+from fuzzyLib.fuzzySetsFol.interval_type2_fuzzy_set import IntervalType2FuzzySet
+from fuzzyLib.utils.membership_functions.membership_functions import gaussian, triangular
+
+
+class TestClauseBank:
+
+    def setup_method(self):
+        self.variable = LinguisticVariable('x', Domain(0, 1.001, 0.001))
+        self.clauses = [Clause(self.variable, adjective, Type1FuzzySet(gaussian(mean, 0.15)))
+                        for adjective, mean in (('Low', 0.), ('Medium', 0.5), ('High', 1.))]
+        self.bank = ClauseBank(self.clauses)
+
+    def test_values_stack_clause_values(self):
+        assert self.bank.values.shape == (3, 1001)
+        assert len(self.bank) == 3
+        for row, clause in zip(self.bank.values, self.clauses):
+            assert np.array_equal(row, clause.values)
+
+    def test_values_are_read_only(self):
+        with pytest.raises(ValueError):
+            self.bank.values[0, 0] = 1.
+
+    @pytest.mark.parametrize('x', [0.0, 0.3337, 1.0, np.array([0.1, 0.25, 0.999])])
+    def test_get_value_matches_clause(self, x):
+        for index, clause in enumerate(self.clauses):
+            assert self.bank.index(clause) == index
+            assert np.array_equal(self.bank.get_value(index, x), clause.get_value(x))
+
+    def test_get_values_matches_clauses(self):
+        x = np.array([0.1, 0.25, 0.999])
+        values = self.bank.get_values(x)
+        assert values.shape == (3, 3)
+        for row, clause in zip(values, self.clauses):
+            assert np.array_equal(row, clause.get_value(x))
+
+    def test_metadata(self):
+        assert self.bank.metadata == [(self.variable, 'Low'), (self.variable, 'Medium'), (self.variable, 'High')]
+
+    def test_interval_type2_values(self):
+        clauses = [Clause(self.variable, 'Low', IntervalType2FuzzySet(triangular(0, 0.2, 0.4, 0.8),
+                                                                     triangular(0, 0.2, 0.4))),
+                   Clause(self.variable, 'High', IntervalType2FuzzySet(triangular(0.5, 0.7, 0.9, 0.8),
+                                                                      triangular(0.5, 0.7, 0.9)))]
+        bank = ClauseBank(clauses)
+        assert bank.values.shape == (2, 2, 1001)
+        assert all(res == approx(exp) for res, exp in zip(bank.get_value(1, 0.6), clauses[1].get_value(0.6)))
+
+    def test_empty_bank(self):
+        with pytest.raises(ValueError):
+            ClauseBank([])
+
+    def test_different_domains(self):
+        other = Clause(LinguisticVariable('y', Domain(0, 2, 0.001)), 'Low', Type1FuzzySet(gaussian(0., 0.15)))
+        with pytest.raises(ValueError):
+            ClauseBank(self.clauses + [other])
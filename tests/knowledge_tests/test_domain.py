@@ -0,0 +1,43 @@
+import pytest
+import numpy as np
+
+from tests.test_tools import approx
+from fuzzyLib.knowledge.linguistic_variable import Domain, LinguisticVariable
+from fuzzyLib.knowledge.clause import Clause
+from fuzzyLib.fuzzySetsFol.type1_fuzzy_set import Type1FuzzySet
+from fuzzyLib.utils.membership_functions.membership_functions import gaussian
+
+DOMAINS = [(0, 1, 0.3), (0, 1, 0.4), (-1, 1, 0.15), (0, 1.001, 0.001), (0, 1, 0.1), (0, 0.3, 0.1), (2, 7.5, 0.7)]
+
+
+class TestDomain:
+
+    @pytest.mark.parametrize('min_value, max_value, precision', DOMAINS)
+    def test_matches_arange(self, min_value, max_value, precision):
+        domain = Domain(min_value, max_value, precision)
+        expected = np.arange(min_value, max_value, precision)
+        assert domain.size == len(expected)
+        assert len(domain()) == len(expected)
+        assert all(res == approx(exp) for res, exp in zip(domain(), expected))
+        assert domain.last == approx(expected[-1])
+
+    def test_values_are_read_only(self):
+        domain = Domain(0, 1, 0.1)
+        with pytest.raises(ValueError):
+            domain()[0] = 1.
+
+    @pytest.mark.parametrize('min_value, max_value, precision', DOMAINS)
+    def test_clause_value_on_whole_grid(self, min_value, max_value, precision):
+        domain = Domain(min_value, max_value, precision)
+        mf = gaussian((min_value + max_value) / 2, (max_value - min_value) / 4)
+        clause = Clause(LinguisticVariable('x', domain), 'Medium', Type1FuzzySet(mf))
+        x = np.linspace(domain.min, domain.last + precision / 3, 50)
+        assert all(res == pytest.approx(mf(float(exp)), abs=1e-6)
+                   for res, exp in zip(clause.get_value(x), domain()[np.round((x - domain.min) / precision).astype(int)]))
+        assert clause.get_value(float(x[-1])) == pytest.approx(mf(float(domain.last)), abs=1e-6)
+
+    def test_clause_value_in_last_partial_step(self):
+        domain = Domain(0, 1, 0.3)
+        clause = Clause(LinguisticVariable('x', domain), 'High', Type1FuzzySet(gaussian(1., 0.3)))
+        assert clause.get_value(0.85) == pytest.approx(gaussian(1., 0.3)(0.9), abs=1e-6)
+        assert clause.get_value(np.array([0.85, 0.1])).shape == (2,)
@@ -0,0 +1,54 @@
+import pytest
+import numpy as np
+
+from fuzzyLib.knowledge.linguistic_variable import Domain, LinguisticVariable
+from fuzzyLib.knowledge.clause import Clause
+from fuzzyLib.knowledge.consequents.mamdani_consequent import MamdaniConsequent
+from fuzzyLib.fuzzySetsFol.type1_fuzzy_set import Type1FuzzySet
+from fuzzyLib.fuzzySetsFol.interval_type2_fuzzy_set import IntervalType2FuzzySet
+from fuzzyLib.utils.membership_functions.membership_functions import gaussian
+
+VARIABLE = LinguisticVariable('watering', Domain(0, 1, 0.001))
+
+
+class TestMamdaniConsequent:
+
+    def setup_method(self):
+        self.consequent = MamdaniConsequent(Clause(VARIABLE, 'Low', Type1FuzzySet(gaussian(0.5, 0.1))))
+        self.values = self.consequent.clause.values
+
+    def test_cut(self):
+        cut = self.consequent.output(0.3)
+        assert cut is self.consequent.cut_clause
+        assert np.array_equal(cut.values, np.minimum(self.values, np.float32(0.3)))
+
+    def test_interval_type2_cut(self):
+        consequent = MamdaniConsequent(Clause(VARIABLE, 'Low', IntervalType2FuzzySet(gaussian(0.5, 0.1, 0.8),
+                                                                                     gaussian(0.5, 0.1))))
+        values = consequent.clause.values
+        cut = consequent.output([0.2, 0.4])
+        assert np.array_equal(cut.values, np.minimum(values, np.array([[0.2], [0.4]], dtype=values.dtype)))
+
+    def test_collected_cuts_are_independent(self):
+        firings = [0.2, 0.5, 0.9]
+        cuts = [self.consequent.output(firing) for firing in firings]
+        assert len({id(cut) for cut in cuts}) == len(firings)
+        for cut, firing in zip(cuts, firings):
+            assert np.array_equal(cut.values, np.minimum(self.values, np.float32(firing)))
+
+    def test_cut_without_copy_reuses_clause(self):
+        first = self.consequent.output(0.2, copy=False)
+        first_values = first.values
+        second = self.consequent.output(0.7, copy=False)
+        assert second is first
+        assert second.values is first_values
+        assert np.array_equal(second.values, np.minimum(self.values, np.float32(0.7)))
+
+    def test_cut_without_copy_keeps_copied_cuts(self):
+        kept = self.consequent.output(0.2)
+        self.consequent.output(0.7, copy=False)
+        assert np.array_equal(kept.values, np.minimum(self.values, np.float32(0.2)))
+
+    def test_incorrect_firing(self):
+        with pytest.raises(ValueError):
+            self.consequent.output('high')
@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+
+from tests.test_tools import approx
+from fuzzyLib.knowledge.linguistic_variable import Domain, LinguisticVariable
+from fuzzyLib.knowledge.clause import Clause
+from fuzzyLib.knowledge.consequents import mamdani_rule_base
+from fuzzyLib.knowledge.consequents.mamdani_consequent import MamdaniConsequent
+from fuzzyLib.knowledge.consequents.mamdani_rule_base import MamdaniRuleBase, batch_cut
+from fuzzyLib.fuzzySetsFol.type1_fuzzy_set import Type1FuzzySet
+from fuzzyLib.fuzzySetsFol.interval_type2_fuzzy_set import IntervalType2FuzzySet
+from fuzzyLib.utils import _kernels
+from fuzzyLib.utils.membership_functions.membership_functions import gaussian
+
+VARIABLE = LinguisticVariable('watering', Domain(0, 1, 0.001))
+MEANS = [0.1, 0.4, 0.6, 0.9]
+
+
+def _type1_consequents():
+    return [MamdaniConsequent(Clause(VARIABLE, str(mean), Type1FuzzySet(gaussian(mean, 0.1)))) for mean in MEANS]
+
+
+def _interval_type2_consequents():
+    return [MamdaniConsequent(Clause(VARIABLE, str(mean), IntervalType2FuzzySet(gaussian(mean, 0.1, 0.8),
+                                                                                gaussian(mean, 0.1))))
+            for mean in MEANS]
+
+
+def _reference(consequents, firings):
+    # cut of every consequent on its own, aggregated by maximum, firings are cast to the type of clause values
+    cuts = []
+    for consequent, firing in zip(consequents, firings):
+        firing = np.asarray(firing, dtype=consequent.clause.values.dtype)
+        cuts.append(np.minimum(consequent.clause.values, firing.reshape(firing.shape + (1,))))
+    return np.max(cuts, axis=0)
+
+
+class TestMamdaniRuleBase:
+
+    @pytest.mark.parametrize('numba_available', [True, False])
+    def test_type1_output(self, numba_available, monkeypatch):
+        monkeypatch.setattr(mamdani_rule_base, 'NUMBA_AVAILABLE', numba_available and mamdani_rule_base.NUMBA_AVAILABLE)
+        consequents = _type1_consequents()
+        firings = [0.3, 0.0, 1.0, 0.55]
+        result = MamdaniRuleBase(consequents).output(firings)
+        assert np.array_equal(result, _reference(consequents, firings))
+
+    @pytest.mark.parametrize('numba_available', [True, False])
+    def test_interval_type2_output(self, numba_available, monkeypatch):
+        monkeypatch.setattr(mamdani_rule_base, 'NUMBA_AVAILABLE', numba_available and mamdani_rule_base.NUMBA_AVAILABLE)
+        consequents = _interval_type2_consequents()
+        firings = [(0.2, 0.3), (0.0, 0.1), (0.7, 1.0), (0.5, 0.55)]
+        result = MamdaniRuleBase(consequents).output(firings)
+        assert result.shape == (2, 1000)
+        assert np.array_equal(result, _reference(consequents, firings))
+
+    def test_output_matches_single_consequents(self):
+        consequents = _type1_consequents()
+        firings = [0.3, 0.8, 0.1, 0.55]
+        cuts = [consequent.output(firing).values for consequent, firing in zip(consequents, firings)]
+        assert np.array_equal(MamdaniRuleBase(consequents).output(firings), np.max(cuts, axis=0))
+
+    def test_wrong_number_of_firings(self):
+        with pytest.raises(ValueError):
+            MamdaniRuleBase(_type1_consequents()).output([0.1, 0.2])
+
+    def test_batch_cut(self):
+        values = np.random.random_sample((4, 50))
+        firings = np.random.random_sample(4)
+        expected = np.stack([np.minimum(row, firing) for row, firing in zip(values, firings)])
+        out = np.empty_like(values)
+        assert batch_cut(values, firings, out=out) is out
+        assert out == approx(expected)
+
+    @pytest.mark.parametrize('dtype', [np.float64, np.float32])
+    def test_cut_and_aggregate_kernel(self, dtype):
+        values = np.random.random_sample((5, 2, 100)).astype(dtype)
+        firings = np.random.random_sample((5, 2)).astype(dtype)
+        out = np.empty((2, 100), dtype=dtype)
+        _kernels.cut_and_aggregate(values, firings, out)
+        assert np.array_equal(out, batch_cut(values, firings).max(axis=0))
@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+
+from tests.test_tools import approx
+from fuzzyLib.knowledge.linguistic_variable import Domain, LinguisticVariable
+from fuzzyLib.knowledge.consequents.takagi_sugeno_consequent import TakagiSugenoConsequent
+
+
+class TestTakagiSugenoConsequent:
+
+    def setup_method(self):
+        domain = Domain(0, 10, 0.01)
+        self.f1 = LinguisticVariable('F1', domain)
+        self.f2 = LinguisticVariable('F2', domain)
+        self.consequent = TakagiSugenoConsequent({self.f1: 2, self.f2: 10}, 1, LinguisticVariable('output', domain))
+
+    def test_output(self):
+        assert self.consequent.output({self.f1: 1, self.f2: 0.5}) == approx(8.)
+
+    def test_output_batch(self):
+        inputs = np.array([[1, 0.5], [0, 0], [2, 1]])
+        expected = [self.consequent.output({self.f1: x1, self.f2: x2}) for x1, x2 in inputs]
+        assert all(res == approx(exp) for res, exp in zip(self.consequent.output_batch(inputs), expected))
+
+    def test_function_parameters_are_read_only(self):
+        with pytest.raises(TypeError):
+            self.consequent.function_parameters[self.f1] = 3.
+
+    def test_passed_dictionary_does_not_change_parameters(self):
+        parameters = {self.f1: 1.}
+        consequent = TakagiSugenoConsequent(parameters, 0, self.f2)
+        parameters[self.f1] = 3.
+        assert consequent.output({self.f1: 0.5}) == approx(0.5)
+
+    def test_assigned_parameters_change_output(self):
+        self.consequent.function_parameters = {**self.consequent.function_parameters, self.f1: 3.}
+        assert self.consequent.output({self.f1: 1, self.f2: 0.5}) == approx(9.)
+
+    @pytest.mark.parametrize('value', [None, '1.5', b'1.5', float('nan'), float('inf'), [1.]])
+    def test_non_numeric_parameters_are_rejected(self, value):
+        parameters = dict(self.consequent.function_parameters)
+        with pytest.raises(ValueError):
+            self.consequent.function_parameters = {self.f1: value, self.f2: 10}
+        assert self.consequent.function_parameters == parameters
+        assert self.consequent.output({self.f1: 1, self.f2: 0.5}) == approx(8.)
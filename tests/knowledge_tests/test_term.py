@@ -0,0 +1,73 @@
+import pytest
+
+from tests.test_tools import approx
+from fuzzyLib.algebras.godel_algebra import GodelAlgebra
+from fuzzyLib.algebras.lukasiewicz_algebra import LukasiewiczAlgebra
+from fuzzyLib.knowledge.linguistic_variable import Domain, LinguisticVariable
+from fuzzyLib.knowledge.clause import Clause
+from fuzzyLib.knowledge.term import Term
+from fuzzyLib.fuzzySetsFol.type1_fuzzy_set import Type1FuzzySet
+from fuzzyLib.utils.membership_functions.membership_functions import gaussian
+
+VARIABLE = LinguisticVariable('x', Domain(0, 1, 0.01))
+CLAUSES = [Clause(VARIABLE, adjective, Type1FuzzySet(gaussian(mean, 0.2)))
+           for adjective, mean in (('A', 0.1), ('B', 0.4), ('C', 0.7), ('D', 0.9))]
+DEGREES = dict(zip(CLAUSES, [0.2, 0.7, 0.5, 0.9]))
+
+
+@pytest.fixture(params=[GodelAlgebra(), LukasiewiczAlgebra()])
+def algebra(request):
+    return request.param
+
+
+def _terms(algebra):
+    return [Term(algebra, clause) for clause in CLAUSES]
+
+
+class TestTerm:
+
+    def test_leaf_fire(self, algebra):
+        a, b, c, d = _terms(algebra)
+        assert a.fire(DEGREES) == approx(0.2)
+        assert a.name == 'x_A'
+
+    def test_mixed_chain(self, algebra):
+        a, b, c, d = _terms(algebra)
+        t, s = algebra.t_norm, algebra.s_norm
+        va, vb, vc, vd = (DEGREES[clause] for clause in CLAUSES)
+        assert (a & b | c).fire(DEGREES) == approx(s(t(va, vb), vc))
+        assert (a | b & c).fire(DEGREES) == approx(s(va, t(vb, vc)))
+        assert (a & b & c | d).fire(DEGREES) == approx(s(t(t(va, vb), vc), vd))
+        assert ((a | b) & (c | d)).fire(DEGREES) == approx(t(s(va, vb), s(vc, vd)))
+        assert (a & b | c).name == 'x_A & x_B | x_C'
+
+    def test_chain_does_not_change_its_parts(self, algebra):
+        a, b, c, d = _terms(algebra)
+        t = algebra.t_norm
+        ab = a & b
+        _ = ab | c
+        _ = ab & d
+        assert ab.fire(DEGREES) == approx(t(DEGREES[CLAUSES[0]], DEGREES[CLAUSES[1]]))
+
+    def test_custom_fire_is_used_in_chain(self, algebra):
+        a, b, c, d = _terms(algebra)
+        a.fire = lambda dict_: 1.
+        assert (a & b).fire(DEGREES) == approx(algebra.t_norm(1., DEGREES[CLAUSES[1]]))
+
+    def test_memoized_firing(self, algebra, monkeypatch):
+        monkeypatch.setattr(Term, 'MEMOIZE_FIRING', True)
+        a, b, c, d = _terms(algebra)
+        t, s = algebra.t_norm, algebra.s_norm
+        shared = a & b
+        calls = []
+        fire = shared.fire
+        shared.fire = lambda dict_: calls.append(1) or fire(dict_)
+        first, second = shared | c, shared & d
+        degrees = dict(DEGREES)
+        ab = t(degrees[CLAUSES[0]], degrees[CLAUSES[1]])
+        assert first.fire(degrees) == approx(s(ab, degrees[CLAUSES[2]]))
+        assert second.fire(degrees) == approx(t(ab, degrees[CLAUSES[3]]))
+        assert len(calls) == 1
+        new_degrees = {**DEGREES, CLAUSES[0]: 1.}
+        assert first.fire(new_degrees) == approx(s(t(1., new_degrees[CLAUSES[1]]), new_degrees[CLAUSES[2]]))
+        assert len(calls) == 2
@@ -0,0 +1,129 @@
+import pytest
+import numpy as np
+
+from tests.test_tools import approx
+from fuzzyLib.utils.membership_functions import membership_functions
+from fuzzyLib.utils.membership_functions.membership_functions import gaussian, triangular, trapezoidal, \
+    gaussian_parameters, generate_equal_gausses, generate_progressive_gausses, generate_even_triangulars, \
+    generate_full_triangulars, generate_even_trapezoidals, generate_full_trapezoidals, GaussianBank
+
+calculate_sigma = getattr(membership_functions, '__calculate_sigma')
+X = np.linspace(-0.1, 1.1, 1201)
+
+
+def _evaluate(bank, x):
+    return np.stack([mf(x) for mf in bank], axis=-1)
+
+
+def _even_triangulars(n_mfs, start, end, max_value=1):
+    step = (end - start) / (n_mfs + 1)
+    fuzzy_sets = []
+    for _ in range(n_mfs):
+        fuzzy_sets.append(triangular(start, start + step, start + 2 * step, max_value))
+        start += step
+    return fuzzy_sets
+
+
+def _full_triangulars(n_mfs, start, end, max_value=1):
+    step = (end - start) / (n_mfs - 1)
+    fuzzy_sets = [triangular(start - 0.001, start, start + step, max_value)]
+    for _ in range(n_mfs - 2):
+        fuzzy_sets.append(triangular(start, start + step, start + 2 * step, max_value))
+        start += step
+    fuzzy_sets.append(triangular(end - step, end, end + 0.001, max_value))
+    return fuzzy_sets
+
+
+def _even_trapezoidals(n_mfs, start, end, max_value=1):
+    step = (end - start) / (2 * n_mfs + 1)
+    fuzzy_sets = []
+    for _ in range(n_mfs):
+        fuzzy_sets.append(trapezoidal(start, start + step, start + 2 * step, start + 3 * step, max_value))
+        start += 2 * step
+    return fuzzy_sets
+
+
+def _full_trapezoidals(n_mfs, start, end, max_value=1):
+    step = (end - start) / (2 * n_mfs - 1)
+    fuzzy_sets = [trapezoidal(start - 0.001, start, start + step, start + 2 * step, max_value)]
+    start += step
+    for _ in range(n_mfs - 2):
+        fuzzy_sets.append(triangular(start, start + step, start + 2 * step, max_value))
+        start += step
+    fuzzy_sets.append(trapezoidal(end - 2 * step, end - step, end, end + 0.001, max_value))
+    return fuzzy_sets
+
+
+class TestCalculateSigma:
+
+    # reference values solved symbolically with sympy by the previous implementation
+    @pytest.mark.parametrize('first_mean, second_mean, max_value, sigma', [
+        (0., 0.25, 1., 0.10616522503600238),
+        (0.1, 0.37, 0.8, 0.09972455884374003),
+        (0.5, 0.2, 1.5, 0.1977515343525805),
+        (0., 0.333, 1., 0.14141207974795517),
+    ])
+    def test_matches_symbolic_solution(self, first_mean, second_mean, max_value, sigma):
+        assert calculate_sigma(first_mean, second_mean, max_value) == pytest.approx(sigma, rel=1e-12)
+
+    @pytest.mark.parametrize('max_value', [1., 0.8, 0.5, 1.5])
+    def test_gausses_cross_at_half_of_height(self, max_value):
+        sigma = calculate_sigma(0.2, 0.6, max_value)
+        assert np.exp(-(0.2 * 0.2) / (2 * sigma * sigma)) == approx(max_value / 2)
+
+    @pytest.mark.parametrize('max_value', [0., 2., 3.])
+    def test_no_cross_point(self, max_value):
+        with pytest.raises(ValueError):
+            calculate_sigma(0., 1., max_value)
+
+
+class TestBanks:
+
+    @pytest.mark.parametrize('n_mfs, max_value', [(3, 1.), (5, 0.8), (7, 1.)])
+    def test_gaussian_bank(self, n_mfs, max_value):
+        bank = generate_equal_gausses(n_mfs, 0., 1., max_value)
+        step = 1. / (n_mfs - 1)
+        sigma = calculate_sigma(0., step, max_value)
+        expected = np.stack([gaussian(i * step, sigma, max_value)(X) for i in range(n_mfs)], axis=-1)
+        assert isinstance(bank, GaussianBank)
+        assert len(bank) == n_mfs
+        assert bank(X) == approx(expected)
+        assert _evaluate(bank, X) == approx(expected)
+        assert bank(0.3) == approx(expected[np.argmin(np.abs(X - 0.3))])
+        assert gaussian_parameters(bank[1]) == approx((step, sigma, max_value))
+
+    def test_gaussian_bank_keeps_single_precision(self):
+        bank = generate_equal_gausses(5, 0., 1.)
+        assert bank(X.astype(np.float32)).dtype == np.float32
+        assert bank(X).dtype == np.float64
+
+    def test_bank_sequence_protocol(self):
+        bank = generate_even_triangulars(4, 0., 1.)
+        assert bank[1] is bank[1]
+        assert len(bank[1:3]) == 2
+        assert list(bank)[-1] is bank[-1]
+
+    @pytest.mark.parametrize('generator, reference', [
+        (generate_even_triangulars, _even_triangulars),
+        (generate_full_triangulars, _full_triangulars),
+        (generate_even_trapezoidals, _even_trapezoidals),
+        (generate_full_trapezoidals, _full_trapezoidals),
+    ])
+    @pytest.mark.parametrize('n_mfs, max_value', [(2, 1.), (3, 0.8), (5, 1.), (8, 0.8)])
+    def test_linear_banks_match_previous_generators(self, generator, reference, n_mfs, max_value):
+        bank = generator(n_mfs, 0., 1., max_value)
+        expected = _evaluate(reference(n_mfs, 0., 1., max_value), X)
+        assert len(bank) == n_mfs
+        assert bank(X) == approx(expected)
+        assert _evaluate(bank, X) == approx(expected)
+        assert all(bank(value) == approx([mf(value) for mf in bank]) for value in X[::50].tolist())
+
+    @pytest.mark.parametrize('n_mfs', [3, 5, 7])
+    def test_progressive_gausses_are_memberships(self, n_mfs):
+        gausses = generate_progressive_gausses(n_mfs, 0.4)
+        assert len(gausses) == n_mfs
+        assert all(0. <= gauss(value) <= 1. for gauss in gausses for value in X.tolist())
+
+    def test_bank_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            membership_functions._MembershipFunctionBank(3)